@@ -0,0 +1,397 @@
+"""Headless microbenchmarks for the game's hot paths.
+
+Each subsystem is driven through a range of entity counts and timed call by
+call. Run from the repository root:
+
+    python benchmarks/bench_suite.py
+    python benchmarks/bench_suite.py --out results.json
+    python benchmarks/bench_suite.py --baseline results.json --threshold 0.15
+    python benchmarks/bench_suite.py --filter particles --filter hud
+
+With --baseline the exit status is 1 if any case's median time regressed
+by more than the threshold.
+"""
+
+import argparse
+import os
+import random
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import numpy as np
+import pygame
+
+from config.settings import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    PLAYER_LASER_SPEED,
+    PARTICLE_COLORS,
+    SIMULATION_RATE,
+    GAME_OPTIONS
+)
+from harness import BenchResult, run_case, write_results, compare, print_table
+
+STEP = 1.0 / SIMULATION_RATE
+PARTICLE_COUNTS = (100, 1000, 10000)
+ALIEN_COUNTS = (100, 500, 1000, 4000)
+LASER_COUNTS = (20, 250)
+LASER_COUNT = 20
+SPAWN_COUNTS = (10, 100, 500)
+HORDE_COUNTS = (1000, 4000)
+SOUND_BURSTS = (1, 50, 500)
+KILL_WAVES = (1, 10, 100)
+SEED = 1234
+
+def fill_particles(system, count: int) -> None:
+    """Fill a particle system with count long-lived particles spread over the screen."""
+    rng = np.random.default_rng(SEED)
+    system.count = count
+    system.positions[:count, 0] = rng.uniform(0, SCREEN_WIDTH, count)
+    system.positions[:count, 1] = rng.uniform(0, SCREEN_HEIGHT, count)
+    system.velocities[:count] = rng.uniform(-150, 150, (count, 2))
+    # Spread over every alpha level, but long enough to outlive the run
+    system.lifetimes[:count] = rng.uniform(1e3, 1e3 + 1, count)
+    palette = [system.stamps.color_id(color) for colors in PARTICLE_COLORS.values() for color in colors]
+    system.color_ids[:count] = rng.choice(palette, count)
+
+def particle_cases(screen: pygame.Surface) -> List[BenchResult]:
+    """Particle update and draw at growing particle counts."""
+    from core.effects.particle_system import ParticleSystem
+
+    results = []
+    for count in PARTICLE_COUNTS:
+        system = ParticleSystem()
+        fill_particles(system, count)
+        results.append(run_case("particles.update", {"n": count}, lambda _: system.update(STEP)))
+        # Random lifetimes, so draws cover every alpha level
+        system.lifetimes[:count] = np.random.default_rng(SEED).uniform(0.01, 0.75, count)
+        results.append(run_case("particles.draw", {"n": count}, lambda _: system.draw(screen)))
+    return results
+
+def starfield_cases(screen: pygame.Surface) -> List[BenchResult]:
+    """Starfield scrolling and drawing."""
+    from core.effects.starfield import StarField
+
+    starfield = StarField()
+
+    def frame(_):
+        starfield.update(STEP)
+        starfield.draw(screen)
+
+    return [run_case("starfield.update_draw", {}, frame)]
+
+HORDE_ARRAYS = ("x", "y", "prev_y", "type_ids", "last_shot", "cooldowns", "alive")
+
+def horde_scene(state, count: int, rng: random.Random, laser_count: int = LASER_COUNT):
+    """Fill a playing state's horde with count aliens and scatter laser_count player lasers.
+
+    Returns:
+        Untimed setup function restoring the scene before each call
+    """
+    from core.entities.laser import Laser
+
+    horde = state.aliens
+    player = state.player.sprite
+    horde.clear()
+    for _ in range(count):
+        horde.spawn(rng.randint(0, SCREEN_WIDTH), rng.randint(0, SCREEN_HEIGHT - 150), rng.choice(["red", "green", "yellow"]))
+    saved = {name: getattr(horde, name).copy() for name in HORDE_ARRAYS}
+    lasers = [
+        Laser((rng.randint(0, SCREEN_WIDTH), rng.randint(0, SCREEN_HEIGHT)), PLAYER_LASER_SPEED, True)
+        for _ in range(laser_count)
+    ]
+
+    def setup():
+        # Collisions kill aliens and lasers; put every one back in place
+        for name, array in saved.items():
+            getattr(horde, name)[:] = array
+        horde.count = count
+        player.lasers.empty()
+        player.lasers.add(lasers)
+        state.lives = 1000
+        state.effects.clear()
+
+    return setup
+
+def collision_cases() -> List[BenchResult]:
+    """PlayingState.handle_collisions and the horde's laser query with growing alien and laser counts.
+
+    horde.query times only finding the aliens under every laser, once per
+    laser with collide_rect() and in one batched grid query with
+    collide_rects(), to show how the broad phase scales.
+    """
+    from core.states.playing_state import PlayingState
+
+    state = PlayingState(SEED)
+    horde = state.aliens
+    results = []
+    for lasers in LASER_COUNTS:
+        rng = random.Random(SEED)
+        for count in ALIEN_COUNTS:
+            setup = horde_scene(state, count, rng, lasers)
+            results.append(run_case(
+                "collisions.handle_collisions",
+                {"aliens": count, "lasers": lasers},
+                lambda _: state.handle_collisions(),
+                setup=setup
+            ))
+            # The collision pass kills aliens and lasers; query the full scene
+            setup()
+            rects = [laser.rect for laser in state.player.sprite.lasers]
+            results.append(run_case(
+                "collisions.horde_query",
+                {"aliens": count, "lasers": lasers, "method": "per_laser"},
+                lambda _: [horde.collide_rect(rect) for rect in rects]
+            ))
+            results.append(run_case(
+                "collisions.horde_query",
+                {"aliens": count, "lasers": lasers, "method": "grid"},
+                lambda _: horde.collide_rects(rects)
+            ))
+    return results
+
+def horde_cases(screen: pygame.Surface) -> List[BenchResult]:
+    """A full alien tick (descent, collisions, draw) for large hordes."""
+    from core.states.playing_state import PlayingState
+
+    state = PlayingState(SEED)
+    rng = random.Random(SEED)
+
+    def frame(_):
+        state.aliens.update(STEP)
+        state.handle_collisions()
+        state.aliens.draw(screen, 0.5)
+
+    return [
+        run_case("horde.frame", {"aliens": count}, frame, setup=horde_scene(state, count, rng))
+        for count in HORDE_COUNTS
+    ]
+
+def timer_cases() -> List[BenchResult]:
+    """Scheduled alien fire for large armed hordes, one simulation tick per call."""
+    from core.entities.alien_horde import AlienHorde
+    from core.entities.laser import LaserPool
+    from core.utils.scheduler import TimerScheduler
+    from core.utils.sim_clock import SimulationClock
+
+    pool = LaserPool()
+    results = []
+    for count in HORDE_COUNTS:
+        rng = random.Random(SEED)
+        random.seed(SEED)
+        clock = SimulationClock()
+        scheduler = TimerScheduler(clock)
+        lasers = pygame.sprite.Group()
+        horde = AlienHorde(clock=clock, scheduler=scheduler, lasers=lasers)
+        for _ in range(count):
+            horde.spawn(rng.randint(0, SCREEN_WIDTH), rng.randint(0, SCREEN_HEIGHT), rng.choice(["red", "green", "yellow"]))
+
+        def tick(_):
+            clock.advance(STEP)
+            scheduler.run_due()
+
+        result = run_case("timers.alien_fire", {"aliens": count}, tick, setup=pool.reclaim, calls=600)
+        # Shots per tick, to relate the cost to events fired rather than aliens alive
+        result.extra["fired_per_tick"] = round(scheduler.fired / clock.ticks, 1)
+        results.append(result)
+    return results
+
+def hud_cases(screen: pygame.Surface) -> List[BenchResult]:
+    """Score and lives HUD drawing with static and changing values."""
+    from core.ui.score_display import ScoreDisplay
+    from core.ui.lives_display import LivesDisplay
+
+    score_display = ScoreDisplay()
+    lives_display = LivesDisplay()
+    score = [0]
+
+    def static(_):
+        score_display.draw(screen, 1250)
+        lives_display.draw(screen, 3)
+
+    def changing(_):
+        score[0] += 10
+        score_display.draw(screen, score[0])
+        lives_display.draw(screen, 3)
+
+    return [
+        run_case("hud.draw", {"score": "static"}, static),
+        run_case("hud.draw", {"score": "changing"}, changing)
+    ]
+
+def crt_cases(screen: pygame.Surface) -> List[BenchResult]:
+    """CRT overlay drawing."""
+    from core.effects.crt_effect import CRTEffect
+
+    crt = CRTEffect()
+    return [run_case("crt.draw", {}, lambda _: crt.draw(screen))]
+
+def spawn_cases() -> List[BenchResult]:
+    """Spawning aliens into the horde and laser sprites into groups."""
+    from core.entities.alien_horde import AlienHorde
+    from core.entities.laser import Laser, LaserPool
+
+    pool = LaserPool()
+    horde = AlienHorde()
+    results = []
+    for count in SPAWN_COUNTS:
+        rng = random.Random(SEED)
+        coords = [
+            (rng.randint(50, SCREEN_WIDTH - 50), rng.randint(-100, 0), rng.choice(["red", "green", "yellow"]))
+            for _ in range(count)
+        ]
+        group = pygame.sprite.Group()
+
+        def spawn_aliens(_):
+            horde.clear()
+            for x, y, color in coords:
+                horde.spawn(x, y, color)
+
+        def spawn_lasers(_):
+            group.empty()
+            for x, y, _ in coords:
+                group.add(Laser((x, y), PLAYER_LASER_SPEED, True))
+
+        def spawn_pooled_lasers(_):
+            pool.reclaim()
+            for x, y, _ in coords:
+                group.add(pool.acquire((x, y), PLAYER_LASER_SPEED, True))
+
+        results.append(run_case("spawn.aliens", {"n": count}, spawn_aliens, calls=50))
+        results.append(run_case("spawn.lasers", {"n": count}, spawn_lasers, calls=50))
+        if count <= pool.capacity:
+            results.append(run_case("spawn.pooled_lasers", {"n": count}, spawn_pooled_lasers, calls=50))
+    return results
+
+def sound_cases() -> List[BenchResult]:
+    """Bursts of explosion and laser requests scheduled in one frame."""
+    from core.utils.sound_manager import SoundManager
+
+    sounds = SoundManager()
+    GAME_OPTIONS.sound_effects_enabled = True
+    results = []
+    try:
+        for burst in SOUND_BURSTS:
+            def frame(_):
+                for i in range(burst):
+                    sounds.play('explosion' if i % 4 else 'laser')
+                sounds.flush()
+
+            before = sounds.stats()
+            result = run_case("sounds.flush", {"requests": burst}, frame, setup=sounds.stop_all)
+            after = sounds.stats()
+            # Voices actually started per burst, the rest merged or dropped
+            requests = after['requests'] - before['requests']
+            if requests:
+                result.extra["played_ratio"] = round((after['played'] - before['played']) / requests, 3)
+            results.append(result)
+        results.extend(kill_wave_cases(sounds))
+    finally:
+        GAME_OPTIONS.sound_effects_enabled = False
+    return results
+
+def kill_wave_cases(sounds) -> List[BenchResult]:
+    """A wave of aliens shot in one tick, from the collision pass to the sound flush.
+
+    Every kill requests an explosion; the wave must start one voice and
+    merge the other requests.
+
+    Raises:
+        RuntimeError: If the wave's requests are not merged into one voice
+    """
+    from core.entities.laser import Laser
+    from core.states.playing_state import PlayingState
+
+    state = PlayingState(SEED)
+    horde = state.aliens
+    player = state.player.sprite
+    results = []
+    for wave in KILL_WAVES:
+        # A stack of aliens under one laser, all hit in the same tick
+        laser = Laser((SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2), PLAYER_LASER_SPEED, True)
+
+        def setup():
+            sounds.stop_all()
+            horde.clear()
+            for _ in range(wave):
+                horde.spawn(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, "red")
+            player.lasers.empty()
+            player.lasers.add(laser)
+            state.effects.clear()
+
+        def frame(_):
+            state.handle_collisions()
+            sounds.flush()
+
+        setup()
+        before = sounds.stats()
+        frame(None)
+        after = sounds.stats()
+        counts = {name: after[name] - before[name] for name in ("requests", "played", "merged")}
+        if counts != {"requests": wave, "played": 1, "merged": wave - 1}:
+            raise RuntimeError(f"kill wave of {wave}: expected 1 voice and {wave - 1} merged, got {counts}")
+
+        result = run_case("sounds.kill_wave", {"kills": wave}, frame, setup=setup)
+        result.extra.update(counts)
+        results.append(result)
+    return results
+
+SUITES: Dict[str, Callable[..., List[BenchResult]]] = {
+    "particles": particle_cases,
+    "starfield": starfield_cases,
+    "collisions": collision_cases,
+    "horde": horde_cases,
+    "timers": timer_cases,
+    "hud": hud_cases,
+    "crt": crt_cases,
+    "spawn": spawn_cases,
+    "sounds": sound_cases
+}
+SCREEN_SUITES = {"particles", "starfield", "horde", "hud", "crt"}
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", action="append", choices=sorted(SUITES), help="run only these suites")
+    parser.add_argument("--out", metavar="PATH", help="write results to a JSON file")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against a results JSON file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.15,
+        help="relative median slowdown counted as a regression (default 0.15)"
+    )
+    return parser.parse_args()
+
+def main() -> int:
+    """Run the selected suites and report, save and compare results."""
+    args = parse_args()
+    GAME_OPTIONS.music_enabled = False
+    GAME_OPTIONS.sound_effects_enabled = False
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    results: List[BenchResult] = []
+    for name in args.filter or SUITES:
+        suite = SUITES[name]
+        results.extend(suite(screen) if name in SCREEN_SUITES else suite())
+
+    print_table(results)
+    if args.out:
+        write_results(args.out, results)
+        print(f"\nWrote {len(results)} results to {args.out}")
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}")
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
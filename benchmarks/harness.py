@@ -0,0 +1,190 @@
+"""Timing, allocation and baseline comparison helpers for the benchmark suite."""
+
+import gc
+import json
+import platform
+import time
+import tracemalloc
+from dataclasses import dataclass, field, asdict
+from typing import Any, Callable, Dict, List, Optional
+
+@dataclass
+class BenchResult:
+    """Timing and allocation figures for one benchmark case."""
+    name: str
+    params: Dict[str, Any]
+    calls: int
+    mean_us: float
+    p50_us: float
+    p90_us: float
+    p99_us: float
+    max_us: float
+    # Peak traced memory during one call and memory still held after it
+    alloc_peak_bytes: int
+    alloc_retained_bytes: int
+    # Case-specific figures stored with the result but not compared
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        """Get a stable identifier combining the name and parameters."""
+        if not self.params:
+            return self.name
+        args = ",".join(f"{k}={v}" for k, v in sorted(self.params.items()))
+        return f"{self.name}[{args}]"
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Get a percentile from sorted values by nearest rank.
+
+    Args:
+        sorted_values: Values in ascending order
+        fraction: Percentile as a fraction between 0 and 1
+
+    Returns:
+        Value at the percentile
+    """
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def run_case(
+    name: str,
+    params: Dict[str, Any],
+    func: Callable[[Any], Any],
+    setup: Optional[Callable[[], Any]] = None,
+    calls: int = 200,
+    warmup: int = 10,
+    alloc_calls: int = 10
+) -> BenchResult:
+    """Time a benchmark case call by call and measure its allocations.
+
+    Args:
+        name: Case name
+        params: Parameters the case was built with, stored with the result
+        func: Function under test; receives the value returned by setup
+        setup: Untimed function run before every call, e.g. to restore
+            state the call consumes; None to pass None to func
+        calls: Number of timed calls
+        warmup: Untimed calls before measuring, to fill caches
+        alloc_calls: Calls traced with tracemalloc, after the timed calls
+            so tracing overhead doesn't skew the timings
+
+    Returns:
+        Result for the case
+    """
+    for _ in range(warmup):
+        func(setup() if setup else None)
+
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(calls):
+            arg = setup() if setup else None
+            start = time.perf_counter()
+            func(arg)
+            samples.append(time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    samples.sort()
+
+    peak = 0
+    retained = 0
+    tracemalloc.start()
+    try:
+        for _ in range(alloc_calls):
+            arg = setup() if setup else None
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            func(arg)
+            after, call_peak = tracemalloc.get_traced_memory()
+            peak = max(peak, call_peak - before)
+            retained += after - before
+    finally:
+        tracemalloc.stop()
+
+    to_us = 1e6
+    return BenchResult(
+        name=name,
+        params=params,
+        calls=calls,
+        mean_us=sum(samples) / len(samples) * to_us,
+        p50_us=percentile(samples, 0.50) * to_us,
+        p90_us=percentile(samples, 0.90) * to_us,
+        p99_us=percentile(samples, 0.99) * to_us,
+        max_us=samples[-1] * to_us,
+        alloc_peak_bytes=peak,
+        alloc_retained_bytes=retained // max(1, alloc_calls)
+    )
+
+def environment() -> Dict[str, str]:
+    """Describe the machine and library versions results were taken on."""
+    import pygame
+    import numpy
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "pygame": pygame.version.ver,
+        "sdl": ".".join(str(part) for part in pygame.get_sdl_version()),
+        "numpy": numpy.__version__,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")
+    }
+
+def write_results(path: str, results: List[BenchResult]) -> None:
+    """Write results and environment info to a JSON file.
+
+    Args:
+        path: Output file path
+        results: Benchmark results
+    """
+    data = {
+        "environment": environment(),
+        "results": {result.key: asdict(result) for result in results}
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+def compare(results: List[BenchResult], baseline_path: str, threshold: float) -> List[str]:
+    """Compare results against a stored baseline file.
+
+    A case regresses when its median time grows by more than the threshold.
+    Cases missing from either side are skipped.
+
+    Args:
+        results: Current results
+        baseline_path: JSON file written by write_results
+        threshold: Allowed relative slowdown, e.g. 0.1 for 10%
+
+    Returns:
+        Keys of regressed cases
+    """
+    with open(baseline_path) as f:
+        baseline = json.load(f)["results"]
+
+    regressions = []
+    print(f"\n{'case':<52} {'base p50':>10} {'p50':>10} {'change':>8}")
+    for result in results:
+        old = baseline.get(result.key)
+        if old is None:
+            continue
+        change = result.p50_us / old["p50_us"] - 1.0 if old["p50_us"] else 0.0
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(result.key)
+        print(f"{result.key:<52} {old['p50_us']:>10.1f} {result.p50_us:>10.1f} {change:>+7.1%}{flag}")
+    return regressions
+
+def print_table(results: List[BenchResult]) -> None:
+    """Print results as a table, times in microseconds per call."""
+    print(
+        f"{'case':<52} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9} "
+        f"{'peak KiB':>9} {'kept B':>8}"
+    )
+    for result in results:
+        print(
+            f"{result.key:<52} {result.p50_us:>9.1f} {result.p90_us:>9.1f} {result.p99_us:>9.1f} "
+            f"{result.max_us:>9.1f} {result.alloc_peak_bytes / 1024:>9.1f} {result.alloc_retained_bytes:>8}"
+        )
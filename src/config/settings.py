@@ -1,13 +1,18 @@
 """Game configuration and settings."""
 
 from pathlib import Path
-from typing import Tuple, Dict
+from typing import Tuple, Dict, Optional
 
 # Screen settings
 SCREEN_WIDTH: int = 1280
 SCREEN_HEIGHT: int = 720
-FPS: int = 60
+FPS: int = 60  # Render rate cap
+SIMULATION_RATE: int = 60  # Fixed simulation ticks per second
+MAX_SIMULATION_STEPS: int = 5  # Max ticks per rendered frame before dropping time
+REPLAY_KEYFRAME_INTERVAL: int = 60  # Ticks between state checksums in replay files
 SCREEN_SIZE: Tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT)
+DIRTY_RECT_RENDERING: bool = False  # Present only changed regions instead of flipping
+DIRTY_RECT_MAX_COVERAGE: float = 0.5  # Fall back to a full flip above this screen fraction
 
 # Font settings
 FONT_SIZE: int = 36
@@ -30,10 +35,15 @@ FONT_DIR = ASSETS_DIR / "font"
 AUDIO_DIR = ASSETS_DIR / "audio"
 GRAPHICS_DIR = ASSETS_DIR / "graphics"
 
+# Asset cache settings
+ASSET_CACHE_BUDGET: Optional[int] = None  # Max bytes of cached surfaces, None for unlimited
+ASSET_LOADER_THREADS: int = 4  # Worker threads decoding files for the preloader
+ASSET_PRELOAD_FRAME_BUDGET: float = 0.004  # Seconds per frame spent finishing preloaded assets
+
 # Game settings
 PLAYER_LIVES: int = 3
-PLAYER_SPEED: int = 15
-PLAYER_LASER_SPEED: int = -8
+PLAYER_SPEED: int = 900  # Pixels per second
+PLAYER_LASER_SPEED: int = -480  # Pixels per second
 PLAYER_LASER_COOLDOWN: int = 600
 PLAYER_SIZE: Tuple[int, int] = (60, 48)
 PLAYER_LASER_SIZE: Tuple[int, int] = (4, 20)
@@ -47,18 +57,25 @@ ALIEN_X_DISTANCE: int = 60
 ALIEN_Y_DISTANCE: int = 48
 ALIEN_SIZE: Tuple[int, int] = (50, 40)
 ALIEN_SPEED: float = 0.0
-ALIEN_LASER_SPEED: int = 8
+ALIEN_LASER_SPEED: int = 480  # Pixels per second
 ALIEN_LASER_COOLDOWN: Tuple[int, int] = (750, 5000)  # Random interval between shots
 ALIEN_LASER_SIZE: Tuple[int, int] = (8, 25)
-ALIEN_DESCENT_SPEED: float = 2.8125  # Increased by 1.5x from 1.875
+LASER_POOL_CAPACITY: int = 256  # Max lasers in flight, player and aliens combined
+ALIEN_DESCENT_SPEED: float = 168.75  # Pixels per second (2.8125 per frame at 60 FPS)
 ALIEN_SPAWN_DELAY: int = 2000
 ALIEN_MIN_SPAWN_COUNT: int = 1  # Reduced by 50%
 ALIEN_MAX_SPAWN_COUNT: int = 2  # Reduced by 50%
+ALIEN_HORDE_CAPACITY: int = 4096  # Max simultaneous aliens
+ALIEN_FIRE_ENABLED: bool = False  # Arm aliens with scheduled fire (off: aliens never shoot)
 
 # Extra alien settings
 EXTRA_SPAWN_TIME_MIN: int = 400
 EXTRA_SPAWN_TIME_MAX: int = 800
 EXTRA_POINTS: int = 500
+EXTRA_SPEED: int = 180  # Pixels per second
+
+# HUD settings
+HUD_CHARSET: str = "0123456789-: ScoreLives"  # Glyphs pre-rendered for the HUD
 
 # Menu settings
 MENU_FONT_SIZE: int = 36
@@ -69,6 +86,17 @@ PARTICLE_LIFETIME: float = 0.75
 PARTICLE_SPEED: int = 150
 PARTICLE_COUNT: int = 30
 PARTICLE_SIZE: int = 4
+PARTICLE_CAPACITY: int = 50000  # Max live particles per system
+PARTICLE_ALPHA_LEVELS: int = 16  # Pre-rendered fade steps per particle color
+
+# Explosion flipbook settings
+FLIPBOOK_FPS: int = 30
+FLIPBOOK_VARIANTS: int = 2  # Pre-baked variations per explosion kind
+# Default render mode per effect type: 'particles' (simulated) or 'flipbook' (pre-baked)
+EFFECT_QUALITY: Dict[str, str] = {
+    'explosion': 'flipbook',
+    'hit': 'particles'
+}
 PARTICLE_COLORS: dict = {
     'explosion': [(255, 100, 0), (255, 50, 0), (255, 0, 0), (200, 0, 0)],  # Orange to red
     'hit': [(255, 255, 0), (255, 200, 0), (255, 150, 0), (255, 100, 0)]  # Yellow to orange
@@ -80,6 +108,8 @@ STAR_SPEED_MIN: int = 50
 STAR_SPEED_MAX: int = 200
 STAR_SIZE_MIN: int = 1
 STAR_SIZE_MAX: int = 3
+STAR_LAYERS: int = 3  # Parallax layers, each pre-rendered once
+STAR_LAYER_HEIGHT: int = SCREEN_HEIGHT * 2  # Height of each tileable layer
 
 # Scoring
 SCORE_VALUES: Dict[str, int] = {
@@ -90,19 +120,53 @@ SCORE_VALUES: Dict[str, int] = {
 }
 
 # Sound settings
+MIXER_BUFFER: int = 512  # Samples per mixer callback; bounds streamed music to one buffer
+MUSIC_FILE: str = "music.wav"  # Streamed from AUDIO_DIR, never fully decoded
 MUSIC_VOLUME: float = 0.2
 LASER_VOLUME: float = 0.5
 EXPLOSION_VOLUME: float = 0.3
 
+# Sound bank: name -> (file in AUDIO_DIR, channel category, volume)
+SOUND_EFFECTS: Dict[str, Tuple[str, str, float]] = {
+    "laser": ("laser.wav", "weapons", LASER_VOLUME),
+    "explosion": ("explosion.wav", "explosions", EXPLOSION_VOLUME)
+}
+# Reserved mixer channels per sound category
+SOUND_CHANNELS: Dict[str, int] = {
+    "weapons": 4,
+    "explosions": 6
+}
+# Voice limits: name -> (priority, max voices of that sound); higher priority wins
+SOUND_VOICES: Dict[str, Tuple[int, int]] = {
+    "laser": (1, 2),
+    "explosion": (2, 3)
+}
+# Effects playing at once across all categories; below the sum of the limits
+# above, so a burst of explosions cuts off lasers instead of stacking up
+SOUND_MAX_VOICES: int = 4
+
+# Collision settings
+SPATIAL_HASH_CELL_SIZE: int = 64  # Broad-phase grid cell size in pixels, at least ALIEN_SIZE
+
+# CRT effect settings
+CRT_LINE_HEIGHT: int = 3
+CRT_LINE_ALPHA: int = 50
+
 # Obstacle settings
 OBSTACLE_AMOUNT: int = 4
 OBSTACLE_BLOCK_SIZE: int = 6
 OBSTACLE_Y_POSITION: int = SCREEN_HEIGHT - 200
+SHIELD_CRATER_RADIUS: int = 5  # Pixels eroded around each laser impact
 
 # Player constraints
 PLAYER_BOTTOM_MARGIN: int = 50
 PLAYER_SIDE_MARGIN: int = 40
 
+# Profiler settings (toggle in game with F3)
+PROFILER_GRAPH_FRAMES: int = 240  # Frames shown in the frame-time graph
+PROFILER_HISTORY_FRAMES: int = 36000  # Frames kept for the CSV dump
+PROFILER_CSV_PATH: str = "profile.csv"  # Written on exit if the profiler ran
+
 class GameOptions:
     """Game options singleton."""
     
@@ -121,6 +185,7 @@ class GameOptions:
         self.sound_effects_enabled = True
         self.fullscreen = False
         self.difficulty = "Normal"
+        self.effect_quality = dict(EFFECT_QUALITY)
         
     def toggle_crt(self):
         """Toggle CRT effect."""
@@ -137,6 +202,15 @@ class GameOptions:
     def toggle_fullscreen(self):
         """Toggle fullscreen mode."""
         self.fullscreen = not self.fullscreen
+        
+    def set_effect_quality(self, effect_type: str, mode: str):
+        """Choose how an effect type is rendered.
+        
+        Args:
+            effect_type: Type of effect ('explosion' or 'hit')
+            mode: 'particles' or 'flipbook'
+        """
+        self.effect_quality[effect_type] = mode
 
 # Global options instance
 GAME_OPTIONS = GameOptions()
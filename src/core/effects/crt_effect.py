@@ -1,51 +1,72 @@
 """CRT screen effect implementation."""
 
 import pygame
-from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, GRAPHICS_DIR
+from typing import Dict, Tuple
+
+from config.settings import GRAPHICS_DIR, CRT_LINE_HEIGHT, CRT_LINE_ALPHA
+from core.utils.asset_cache import load_image
 
 class CRTEffect:
-    """Applies a CRT screen effect to the game display."""
-    
-    def __init__(self):
-        """Initialize CRT effect."""
-        self.tv = pygame.image.load(str(GRAPHICS_DIR / 'tv.png')).convert_alpha()
-        self.tv = pygame.transform.scale(self.tv, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        
-    def create_crt_lines(self) -> pygame.Surface:
-        """Create the scanline effect.
-        
+    """Applies a CRT screen effect to the game display.
+
+    The scanlines and the TV frame are baked into one premultiplied-alpha
+    overlay per (resolution, line height, line alpha), so drawing the
+    effect costs a single blit per frame.
+    """
+
+    def __init__(self, line_height: int = CRT_LINE_HEIGHT, line_alpha: int = CRT_LINE_ALPHA):
+        """Initialize CRT effect.
+
+        Args:
+            line_height: Vertical distance between scanlines in pixels
+            line_alpha: Opacity of each scanline (0-255)
+        """
+        self.line_height = line_height
+        self.line_alpha = line_alpha
+        self._overlays: Dict[Tuple[Tuple[int, int], int, int], pygame.Surface] = {}
+
+    def create_crt_lines(self, size: Tuple[int, int]) -> pygame.Surface:
+        """Create the premultiplied scanline layer.
+
+        Args:
+            size: (width, height) of the layer
+
         Returns:
             Surface with scanline effect
         """
-        line_height = 3
-        line_amount = int(SCREEN_HEIGHT / line_height)
-        
-        # Create surface for lines
-        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        surface.set_colorkey('black')
-        surface.set_alpha(50)
-        
-        # Draw the lines
-        for line in range(line_amount):
-            y_pos = line * line_height
-            pygame.draw.line(
-                surface,
-                'white',
-                (0, y_pos),
-                (SCREEN_WIDTH, y_pos),
-                1
-            )
-            
+        width, height = size
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        # White at line_alpha, premultiplied
+        color = (self.line_alpha, self.line_alpha, self.line_alpha, self.line_alpha)
+        for y_pos in range(0, height, self.line_height):
+            pygame.draw.line(surface, color, (0, y_pos), (width, y_pos), 1)
         return surface
-        
+
+    def get_overlay(self, size: Tuple[int, int]) -> pygame.Surface:
+        """Get the composited scanline and TV overlay for a resolution.
+
+        Args:
+            size: Screen (width, height)
+
+        Returns:
+            Premultiplied-alpha overlay surface
+        """
+        key = (size, self.line_height, self.line_alpha)
+        overlay = self._overlays.get(key)
+        if overlay is None:
+            # Stale entries for other resolutions or options are dropped
+            self._overlays.clear()
+            overlay = self.create_crt_lines(size)
+            tv = load_image(GRAPHICS_DIR / 'tv.png', size).premul_alpha()
+            overlay.blit(tv, (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
+            self._overlays[key] = overlay
+        return overlay
+
     def draw(self, screen: pygame.Surface) -> None:
         """Apply CRT effect to screen.
-        
+
         Args:
             screen: Pygame surface to apply effect to
         """
-        # Draw scanlines
-        screen.blit(self.create_crt_lines(), (0, 0))
-        
-        # Draw TV overlay
-        screen.blit(self.tv, (0, 0))
+        overlay = self.get_overlay(screen.get_size())
+        screen.blit(overlay, (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
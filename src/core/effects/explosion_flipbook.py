@@ -0,0 +1,217 @@
+"""Pre-baked explosion flipbooks and the effect manager that picks between them and particles."""
+
+import pygame
+import random
+from typing import Dict, List, Sequence, Tuple
+
+from config.settings import (
+    PARTICLE_LIFETIME,
+    PARTICLE_SIZE,
+    FLIPBOOK_FPS,
+    FLIPBOOK_VARIANTS,
+    GAME_OPTIONS
+)
+from core.effects.particle_system import ParticleSystem
+
+FlipbookKey = Tuple[str, int, float]
+
+class ExplosionFlipbook:
+    """Sequence of frames captured from a simulated particle explosion."""
+
+    def __init__(self, effect_type: str, count: int, speed: float, seed: int = 0):
+        """Simulate an explosion and capture it frame by frame.
+
+        Args:
+            effect_type: Type of effect ('explosion' or 'hit')
+            count: Number of particles in the explosion
+            speed: Base speed of particles
+            seed: Seed for the particle simulation
+        """
+        # Particles can travel at most speed * lifetime in each axis
+        half = int(speed * PARTICLE_LIFETIME) + PARTICLE_SIZE + 2
+        canvas = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+
+        system = ParticleSystem(count, seed)
+        system.create_explosion((half, half), effect_type, count, speed)
+
+        # (frame surface, offset of its top-left from the explosion center)
+        self.frames: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        frame_dt = 1.0 / FLIPBOOK_FPS
+        while system.count:
+            canvas.fill((0, 0, 0, 0))
+            system.draw(canvas)
+            bounds = canvas.get_bounding_rect()
+            if bounds.width and bounds.height:
+                frame = canvas.subsurface(bounds).copy()
+                self.frames.append((frame, (bounds.x - half, bounds.y - half)))
+            system.update(frame_dt)
+
+    def __len__(self) -> int:
+        """Get the number of frames."""
+        return len(self.frames)
+
+class FlipbookCache:
+    """Singleton cache of explosion flipbooks keyed by effect parameters."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        """Initialize an empty cache."""
+        self._flipbooks: Dict[FlipbookKey, List[ExplosionFlipbook]] = {}
+
+    def get(self, effect_type: str, count: int, speed: float) -> List[ExplosionFlipbook]:
+        """Get the flipbook variants for an effect, building them on first use.
+
+        Args:
+            effect_type: Type of effect ('explosion' or 'hit')
+            count: Number of particles in the explosion
+            speed: Base speed of particles
+
+        Returns:
+            List of flipbook variants
+        """
+        key: FlipbookKey = (effect_type, count, float(speed))
+        variants = self._flipbooks.get(key)
+        if variants is None:
+            variants = [
+                ExplosionFlipbook(effect_type, count, speed, seed)
+                for seed in range(FLIPBOOK_VARIANTS)
+            ]
+            self._flipbooks[key] = variants
+        return variants
+
+    def prebuild(self, specs: List[FlipbookKey]) -> None:
+        """Build flipbooks ahead of time so gameplay never simulates them.
+
+        Args:
+            specs: List of (effect_type, count, speed) tuples
+        """
+        for effect_type, count, speed in specs:
+            self.get(effect_type, count, speed)
+
+class ExplosionAnimation(pygame.sprite.Sprite):
+    """One playing instance of an explosion flipbook."""
+
+    def __init__(self, flipbook: ExplosionFlipbook, pos: Tuple[float, float]):
+        """Initialize the animation.
+
+        Args:
+            flipbook: Flipbook to play
+            pos: Center position of the explosion
+        """
+        super().__init__()
+        self.flipbook = flipbook
+        self.center = (int(pos[0]), int(pos[1]))
+        self.time = 0.0
+        self.frame_index = -1
+        self._set_frame(0)
+
+    def _set_frame(self, index: int) -> None:
+        """Show a frame of the flipbook.
+
+        Args:
+            index: Frame index
+        """
+        if index == self.frame_index:
+            return
+        self.frame_index = index
+        frame, (dx, dy) = self.flipbook.frames[index]
+        self.image = frame
+        self.rect = frame.get_rect(topleft=(self.center[0] + dx, self.center[1] + dy))
+
+    def update(self, dt: float) -> None:
+        """Advance the animation and remove it when finished.
+
+        Args:
+            dt: Time delta in seconds
+        """
+        self.time += dt
+        index = int(self.time * FLIPBOOK_FPS)
+        if index >= len(self.flipbook):
+            self.kill()
+        else:
+            self._set_frame(index)
+
+class EffectManager:
+    """Spawns explosions as simulated particles or flipbooks based on quality settings."""
+
+    def __init__(self, seed: int = 0):
+        """Initialize the effect manager.
+
+        Args:
+            seed: Seed for the particles and flipbook variant choice; effects
+                keep their own generators and never use the global RNG
+        """
+        self.particles = ParticleSystem(seed=seed)
+        self._rng = random.Random(seed)
+        self.animations = pygame.sprite.Group()
+        self.flipbooks = FlipbookCache()
+
+    def create_explosion(self, pos: Tuple[float, float], effect_type: str, count: int, speed: float) -> None:
+        """Create an explosion effect.
+
+        Args:
+            pos: Center position of explosion
+            effect_type: Type of effect ('explosion' or 'hit')
+            count: Number of particles to create
+            speed: Base speed of particles
+        """
+        if GAME_OPTIONS.effect_quality.get(effect_type) == 'flipbook':
+            variants = self.flipbooks.get(effect_type, count, speed)
+            if variants and len(variants[0]):
+                self.animations.add(ExplosionAnimation(self._rng.choice(variants), pos))
+                return
+        self.particles.create_explosion(pos, effect_type, count, speed)
+
+    def create_explosions(
+        self,
+        positions: Sequence[Tuple[float, float]],
+        effect_type: str,
+        count: int,
+        speed: float
+    ) -> None:
+        """Create the same explosion at several positions.
+
+        Particle explosions are spawned in one batch, which keeps a wave of
+        kills in a single tick cheap.
+
+        Args:
+            positions: Center position of each explosion
+            effect_type: Type of effect ('explosion' or 'hit')
+            count: Number of particles per explosion
+            speed: Base speed of particles
+        """
+        if GAME_OPTIONS.effect_quality.get(effect_type) == 'flipbook':
+            for pos in positions:
+                self.create_explosion(pos, effect_type, count, speed)
+        else:
+            self.particles.create_explosions(positions, effect_type, count, speed)
+
+    def update(self, dt: float) -> None:
+        """Update particles and animations.
+
+        Args:
+            dt: Time delta in seconds
+        """
+        self.particles.update(dt)
+        self.animations.update(dt)
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """Draw particles and animations.
+
+        Args:
+            screen: Surface to draw on
+        """
+        self.animations.draw(screen)
+        self.particles.draw(screen)
+
+    def clear(self) -> None:
+        """Remove all active effects."""
+        self.particles.clear()
+        self.animations.empty()
@@ -0,0 +1,98 @@
+"""Pre-rendered particle sprites."""
+
+import pygame
+from typing import Dict, List, Tuple
+
+from config.settings import (
+    PARTICLE_SIZE,
+    PARTICLE_COLORS,
+    PARTICLE_ALPHA_LEVELS
+)
+
+class ParticleStampCache:
+    """Singleton cache of pre-rendered particle stamps.
+
+    Each color registered in the palette gets one stamp per quantized alpha
+    level. Stamps are stored in a flat list indexed by
+    ``color_id * alpha_levels + level`` so a draw call can look them up
+    without building keys.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        """Pre-render stamps for every configured particle color."""
+        self.size = PARTICLE_SIZE
+        self.alpha_levels = PARTICLE_ALPHA_LEVELS
+        self.palette: List[Tuple[int, int, int]] = []
+        self.stamps: List[pygame.Surface] = []
+        self._color_ids: Dict[Tuple[int, int, int], int] = {}
+
+        self.color_id((255, 0, 0))  # Default color is always id 0
+        for colors in PARTICLE_COLORS.values():
+            for color in colors:
+                self.color_id(color)
+
+    def color_id(self, color: Tuple[int, int, int]) -> int:
+        """Get the palette index for a color, rendering its stamps if new.
+
+        Args:
+            color: RGB color tuple
+
+        Returns:
+            Index of the color in the palette
+        """
+        # Ensure all color components are valid integers between 0 and 255
+        color = tuple(max(0, min(255, int(c))) for c in color)
+        color_id = self._color_ids.get(color)
+        if color_id is None:
+            color_id = len(self.palette)
+            self._color_ids[color] = color_id
+            self.palette.append(color)
+            for level in range(self.alpha_levels):
+                self.stamps.append(self._render(color, self.alpha_for_level(level)))
+        return color_id
+
+    def alpha_for_level(self, level: int) -> int:
+        """Get the alpha value drawn for a quantized level.
+
+        Args:
+            level: Alpha level in [0, alpha_levels)
+
+        Returns:
+            Alpha value (0-255)
+        """
+        return round(255 * level / (self.alpha_levels - 1))
+
+    def _render(self, color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
+        """Render a single particle stamp.
+
+        Args:
+            color: RGB color tuple
+            alpha: Alpha value (0-255)
+
+        Returns:
+            Surface containing the particle circle
+        """
+        size = self.size * 2 + 1
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (*color, alpha), (self.size + 1, self.size + 1), self.size)
+        return surface
+
+    def get(self, color: Tuple[int, int, int], level: int) -> pygame.Surface:
+        """Get the stamp for a color and alpha level.
+
+        Args:
+            color: RGB color tuple
+            level: Alpha level in [0, alpha_levels)
+
+        Returns:
+            Pre-rendered stamp surface
+        """
+        return self.stamps[self.color_id(color) * self.alpha_levels + level]
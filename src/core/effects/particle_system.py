@@ -1,132 +1,163 @@
 """Particle system for visual effects."""
 
 import pygame
-import random
-from typing import List, Tuple
-from math import sin, cos, pi
+import numpy as np
+from typing import Dict, Sequence, Tuple
 
 from config.settings import (
     PARTICLE_LIFETIME,
     PARTICLE_SIZE,
-    PARTICLE_COLORS
+    PARTICLE_COLORS,
+    PARTICLE_CAPACITY
 )
+from core.effects.particle_stamps import ParticleStampCache
+from core.utils.profiler import PROFILER
+
+class ParticleSystem:
+    """Structure-of-arrays particle engine.
+
+    Particle state lives in preallocated NumPy arrays. Live particles always
+    occupy indices [0, count); dead ones are removed by moving live particles
+    from the tail into the holes they leave.
+    """
+
+    def __init__(self, capacity: int = PARTICLE_CAPACITY, seed: int = 0):
+        """Initialize particle system.
 
-class Particle:
-    """Individual particle with position, velocity, and lifetime."""
-    
-    def __init__(self, pos: Tuple[float, float], velocity: Tuple[float, float], color: Tuple[int, int, int]):
-        """Initialize particle.
-        
-        Args:
-            pos: Initial (x, y) position
-            velocity: (vx, vy) velocity
-            color: RGB color tuple
-        """
-        self.x, self.y = float(pos[0]), float(pos[1])
-        self.vx, self.vy = velocity
-        # Ensure color is a valid RGB tuple
-        if not isinstance(color, (tuple, list)) or len(color) != 3:
-            self.color = (255, 0, 0)  # Default to red if invalid
-        else:
-            # Ensure all color components are valid integers between 0 and 255
-            self.color = tuple(max(0, min(255, int(c))) for c in color)
-        self.lifetime = PARTICLE_LIFETIME
-        
-    def update(self, dt: float) -> None:
-        """Update particle position and lifetime.
-        
         Args:
-            dt: Time delta in seconds
+            capacity: Maximum number of live particles
+            seed: Seed for the particle random generator
         """
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.lifetime -= dt
-        
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw particle on screen.
-        
+        self.capacity = capacity
+        self.count = 0
+        self.positions = np.zeros((capacity, 2), dtype=np.float32)
+        self.velocities = np.zeros((capacity, 2), dtype=np.float32)
+        self.lifetimes = np.zeros(capacity, dtype=np.float32)
+        # Index into the stamp cache palette
+        self.color_ids = np.zeros(capacity, dtype=np.int32)
+
+        self.stamps = ParticleStampCache()
+        self._effect_color_ids: Dict[str, np.ndarray] = {}
+        for effect_type, colors in PARTICLE_COLORS.items():
+            self._effect_color_ids[effect_type] = np.array(
+                [self.stamps.color_id(color) for color in colors], dtype=np.int32
+            )
+        # A private generator, so effects never draw from the simulation's RNG
+        self._rng = np.random.default_rng(seed)
+
+    def seed(self, seed: int) -> None:
+        """Reseed the particle random generator.
+
         Args:
-            screen: Surface to draw on
+            seed: Seed value
         """
-        try:
-            alpha = int(max(0, min(255, 255 * (self.lifetime / PARTICLE_LIFETIME))))
-            # Create a surface for the particle with alpha channel
-            particle_surface = pygame.Surface((PARTICLE_SIZE * 2 + 1, PARTICLE_SIZE * 2 + 1), pygame.SRCALPHA)
-            # Create RGBA color tuple
-            color_with_alpha = (
-                self.color[0],
-                self.color[1],
-                self.color[2],
-                alpha
-            )
-            # Draw the particle
-            pygame.draw.circle(
-                particle_surface,
-                color_with_alpha,
-                (PARTICLE_SIZE + 1, PARTICLE_SIZE + 1),
-                PARTICLE_SIZE
-            )
-            # Blit the particle surface onto the screen
-            screen.blit(
-                particle_surface,
-                (int(self.x - PARTICLE_SIZE), int(self.y - PARTICLE_SIZE))
-            )
-        except (ValueError, IndexError, TypeError):
-            # If any error occurs, skip drawing this particle
-            pass
+        self._rng = np.random.default_rng(seed)
 
-class ParticleSystem:
-    """System to manage multiple particles."""
-    
-    def __init__(self):
-        """Initialize particle system."""
-        self.particles: List[Particle] = []
-        
     def create_explosion(self, pos: Tuple[float, float], effect_type: str, count: int, speed: float) -> None:
         """Create an explosion effect.
-        
+
+        Particles beyond the system capacity are dropped.
+
         Args:
             pos: Center position of explosion
             effect_type: Type of effect ('explosion' or 'hit')
             count: Number of particles to create
             speed: Base speed of particles
         """
-        try:
-            colors = PARTICLE_COLORS.get(effect_type, [(255, 0, 0)])  # Default to red if effect type not found
-            for _ in range(count):
-                angle = random.uniform(0, 2 * pi)
-                velocity = (
-                    speed * cos(angle) * random.uniform(0.2, 1.0),
-                    speed * sin(angle) * random.uniform(0.2, 1.0)
-                )
-                color = random.choice(colors)
-                self.particles.append(Particle(pos, velocity, color))
-        except (KeyError, AttributeError):
-            # If any error occurs with colors, create a simple red explosion
-            for _ in range(count):
-                angle = random.uniform(0, 2 * pi)
-                velocity = (
-                    speed * cos(angle) * random.uniform(0.2, 1.0),
-                    speed * sin(angle) * random.uniform(0.2, 1.0)
-                )
-                self.particles.append(Particle(pos, velocity, (255, 0, 0)))
-            
+        self.create_explosions([pos], effect_type, count, speed)
+
+    def create_explosions(
+        self,
+        positions: Sequence[Tuple[float, float]],
+        effect_type: str,
+        count: int,
+        speed: float
+    ) -> None:
+        """Create one explosion at each of several positions in a single batch.
+
+        Equivalent to calling create_explosion() for each position in
+        order, with one set of array operations instead of one per
+        explosion. Particles beyond the system capacity are dropped.
+
+        Args:
+            positions: Center position of each explosion
+            effect_type: Type of effect ('explosion' or 'hit')
+            count: Number of particles per explosion
+            speed: Base speed of particles
+        """
+        total = min(count * len(positions), self.capacity - self.count)
+        if total <= 0:
+            return
+        start, end = self.count, self.count + total
+        rng = self._rng
+
+        angles = rng.uniform(0.0, 2 * np.pi, total)
+        self.velocities[start:end, 0] = speed * np.cos(angles) * rng.uniform(0.2, 1.0, total)
+        self.velocities[start:end, 1] = speed * np.sin(angles) * rng.uniform(0.2, 1.0, total)
+        centers = np.asarray(positions, dtype=np.float32).reshape(-1, 2)
+        self.positions[start:end] = np.repeat(centers, count, axis=0)[:total]
+        self.lifetimes[start:end] = PARTICLE_LIFETIME
+
+        # Default to red if effect type not found
+        color_ids = self._effect_color_ids.get(effect_type)
+        if color_ids is None:
+            self.color_ids[start:end] = 0
+        else:
+            self.color_ids[start:end] = rng.choice(color_ids, total)
+        self.count = end
+
     def update(self, dt: float) -> None:
         """Update all particles.
-        
+
         Args:
             dt: Time delta in seconds
         """
-        # Update and remove dead particles
-        self.particles = [p for p in self.particles if p.lifetime > 0]
-        for particle in self.particles:
-            particle.update(dt)
-            
+        n = self.count
+        if n == 0:
+            return
+        self.positions[:n] += self.velocities[:n] * dt
+        self.lifetimes[:n] -= dt
+        self._compact()
+
+    def _compact(self) -> None:
+        """Remove dead particles by swapping live ones from the tail into their slots."""
+        n = self.count
+        dead = np.flatnonzero(self.lifetimes[:n] <= 0)
+        if dead.size == 0:
+            return
+        new_count = n - dead.size
+        # Holes below the new count must be filled by live particles above it
+        holes = dead[dead < new_count]
+        if holes.size:
+            tail = np.arange(new_count, n)
+            sources = tail[self.lifetimes[new_count:n] > 0]
+            for array in (self.positions, self.velocities, self.lifetimes, self.color_ids):
+                array[holes] = array[sources]
+        self.count = new_count
+
+    def clear(self) -> None:
+        """Remove all particles."""
+        self.count = 0
+
     def draw(self, screen: pygame.Surface) -> None:
         """Draw all particles.
-        
+
         Args:
             screen: Surface to draw on
         """
-        for particle in self.particles:
-            particle.draw(screen)
+        n = self.count
+        if n == 0:
+            return
+        levels = self.stamps.alpha_levels
+        # Quantize remaining lifetime into an alpha level, rounding up so
+        # particles only vanish once their lifetime is spent
+        alpha_ids = np.ceil(self.lifetimes[:n] * ((levels - 1) / PARTICLE_LIFETIME))
+        alpha_ids = np.clip(alpha_ids, 0, levels - 1).astype(np.int32)
+        stamp_ids = self.color_ids[:n] * levels + alpha_ids
+        corners = (self.positions[:n] - PARTICLE_SIZE).astype(np.int32)
+        stamps = self.stamps.stamps
+        screen.blits(
+            zip([stamps[i] for i in stamp_ids.tolist()], corners.tolist()),
+            doreturn=False
+        )
+        PROFILER.count('blits', n)
@@ -2,62 +2,125 @@
 
 import pygame
 import random
-from typing import List, Tuple
-
-from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
-
-class Star:
-    """Individual star in the starfield."""
-    
-    def __init__(self):
-        """Initialize a star with random position and speed."""
-        self.x = random.randint(0, SCREEN_WIDTH)
-        self.y = random.randint(0, SCREEN_HEIGHT)
-        self.speed = random.uniform(0.5, 2.0)
-        self.brightness = random.randint(100, 255)
-        self.size = random.randint(1, 3)
-        
+from typing import List
+
+from config.settings import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    STAR_COUNT,
+    STAR_SPEED_MIN,
+    STAR_SPEED_MAX,
+    STAR_SIZE_MIN,
+    STAR_SIZE_MAX,
+    STAR_LAYERS,
+    STAR_LAYER_HEIGHT
+)
+
+class StarLayer:
+    """Pre-rendered, vertically tileable layer of stars scrolling at one speed."""
+
+    def __init__(
+        self,
+        num_stars: int,
+        speed: float,
+        size: int,
+        brightness: range,
+        opaque: bool,
+        rng: random.Random
+    ):
+        """Render the layer.
+
+        Args:
+            num_stars: Number of stars drawn into the layer
+            speed: Scroll speed in pixels per second
+            size: Star radius in pixels
+            brightness: Range of gray levels to pick star colors from
+            opaque: Whether the layer has a solid black background
+            rng: Random generator placing the stars
+        """
+        self.speed = speed
+        self.offset = 0.0
+        self.height = STAR_LAYER_HEIGHT
+
+        surface = pygame.Surface((SCREEN_WIDTH, self.height))
+        surface.fill((0, 0, 0))
+        for _ in range(num_stars):
+            x = rng.randint(0, SCREEN_WIDTH)
+            y = rng.randint(0, self.height - 1)
+            level = rng.choice(brightness)
+            color = (level, level, level)
+            pygame.draw.circle(surface, color, (x, y), size)
+            # Draw wrapped copies so the layer tiles seamlessly
+            if y < size:
+                pygame.draw.circle(surface, color, (x, y + self.height), size)
+            elif y >= self.height - size:
+                pygame.draw.circle(surface, color, (x, y - self.height), size)
+        if not opaque:
+            surface.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        self.surface = surface
+
     def update(self, dt: float) -> None:
-        """Update star position.
-        
+        """Scroll the layer.
+
         Args:
             dt: Delta time in seconds
         """
-        self.y += self.speed * dt * 60
-        if self.y > SCREEN_HEIGHT:
-            self.y = 0
-            self.x = random.randint(0, SCREEN_WIDTH)
-            self.brightness = random.randint(100, 255)
+        self.offset = (self.offset + self.speed * dt) % self.height
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """Draw the visible part of the layer with at most two blits.
+
+        Args:
+            screen: Surface to draw on
+        """
+        # Layer row shown at the top of the screen
+        top = int(self.height - self.offset) % self.height
+        visible = min(SCREEN_HEIGHT, self.height - top)
+        screen.blit(self.surface, (0, 0), (0, top, SCREEN_WIDTH, visible))
+        if visible < SCREEN_HEIGHT:
+            screen.blit(self.surface, (0, visible), (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT - visible))
 
 class StarField:
-    """Dynamic starry background effect."""
-    
-    def __init__(self, num_stars: int = 100):
+    """Dynamic starry background effect built from parallax layers.
+
+    Stars are baked into a few layers at startup, so per-frame cost depends
+    on the number of layers rather than the number of stars.
+    """
+
+    def __init__(self, num_stars: int = STAR_COUNT, num_layers: int = STAR_LAYERS, seed: int = 0):
         """Initialize the starfield.
-        
+
         Args:
-            num_stars: Number of stars to create
+            num_stars: Number of stars to create across all layers
+            num_layers: Number of parallax layers
+            seed: Seed for star placement; the global RNG is left untouched
         """
-        self.stars = [Star() for _ in range(num_stars)]
-        self.surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        
+        rng = random.Random(seed)
+        self.layers: List[StarLayer] = []
+        for index in range(num_layers):
+            # Far layers are slow, small and dim; near layers are fast, large and bright
+            depth = index / max(1, num_layers - 1)
+            speed = STAR_SPEED_MIN + (STAR_SPEED_MAX - STAR_SPEED_MIN) * depth
+            size = round(STAR_SIZE_MIN + (STAR_SIZE_MAX - STAR_SIZE_MIN) * depth)
+            low = 100 + int(100 * depth)
+            # Each layer is taller than the screen, so scale star count to keep density
+            stars = num_stars // num_layers * STAR_LAYER_HEIGHT // SCREEN_HEIGHT
+            self.layers.append(StarLayer(stars, speed, size, range(low, 256), index == 0, rng))
+
     def update(self, dt: float) -> None:
-        """Update all stars.
-        
+        """Scroll all layers.
+
         Args:
             dt: Delta time in seconds
         """
-        for star in self.stars:
-            star.update(dt)
-            
+        for layer in self.layers:
+            layer.update(dt)
+
     def draw(self, screen: pygame.Surface) -> None:
         """Draw the starfield.
-        
+
         Args:
             screen: Surface to draw on
         """
-        self.surface.fill((0, 0, 0))
-        for star in self.stars:
-            color = (star.brightness, star.brightness, star.brightness)
-            pygame.draw.circle(self.surface, color, (int(star.x), int(star.y)), star.size)
-        screen.blit(self.surface, (0, 0))
+        for layer in self.layers:
+            layer.draw(screen)
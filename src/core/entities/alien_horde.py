@@ -0,0 +1,340 @@
+"""Array-backed container for large numbers of aliens."""
+
+from random import randint
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+import pygame
+
+from config.settings import (
+    GRAPHICS_DIR,
+    SCREEN_HEIGHT,
+    ALIEN_SIZE,
+    ALIEN_DESCENT_SPEED,
+    ALIEN_LASER_SPEED,
+    ALIEN_LASER_COOLDOWN,
+    ALIEN_HORDE_CAPACITY,
+    SPATIAL_HASH_CELL_SIZE,
+    SCORE_VALUES
+)
+from core.entities.laser import LaserPool
+from core.utils.asset_cache import load_image
+from core.utils.sim_clock import SimulationClock
+from core.utils.scheduler import TimerScheduler
+from core.utils.profiler import PROFILER
+
+ALIEN_COLORS = ('red', 'green', 'yellow')
+
+class AlienHorde:
+    """All aliens of a game stored as NumPy arrays instead of sprites.
+
+    Behaves like the old group of Alien sprites: each alien descends at
+    ALIEN_DESCENT_SPEED, leaves once below the screen and has its own
+    random shot cooldown. Live aliens occupy indices [0, count) in spawn
+    order. Aliens killed during a tick only have their alive flag cleared
+    and are removed by the next compact(), so indices stay valid until then.
+
+    Armed aliens don't poll their cooldowns: each one keeps a timer in the
+    scheduler for its next shot, identified by a spawn id that survives
+    compaction. Timers of aliens that died are dropped when they come due.
+
+    collide_rects() is the broad phase for many rects at once: aliens are
+    bucketed into a uniform grid by their top-left corner and each rect is
+    only tested against the aliens in cells it can reach.
+    """
+
+    # Grid keys pack (column, row) so each column's rows form one sorted run
+    GRID_OFFSET = 1 << 15
+    GRID_STRIDE = 1 << 16
+
+    def __init__(
+        self,
+        capacity: int = ALIEN_HORDE_CAPACITY,
+        clock: Optional[SimulationClock] = None,
+        scheduler: Optional[TimerScheduler] = None,
+        lasers: Optional[pygame.sprite.Group] = None
+    ):
+        """Initialize an empty horde.
+
+        Args:
+            capacity: Maximum number of aliens; spawns beyond it are dropped
+            clock: Simulation clock for shot timing, None for a private one
+            scheduler: Scheduler for shot timers, sharing the clock
+            lasers: Group that fired lasers are added to; without it (or
+                without a scheduler) the aliens never fire
+        """
+        self.clock = clock if clock is not None else SimulationClock()
+        self.scheduler = scheduler
+        self.lasers = lasers
+        self.armed = scheduler is not None and lasers is not None
+        self.capacity = capacity
+        self.count = 0
+        self.width, self.height = ALIEN_SIZE
+        # Top-left corners; y is fractional and truncated like Alien.rect.y
+        self.x = np.zeros(capacity, dtype=np.int32)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.prev_y = np.zeros(capacity, dtype=np.float64)
+        self.type_ids = np.zeros(capacity, dtype=np.int8)
+        self.last_shot = np.zeros(capacity, dtype=np.int64)
+        self.cooldowns = np.zeros(capacity, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=bool)
+        # Increasing spawn ids; compaction keeps them sorted
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self._next_id = 0
+
+        # One surface and score value per color. The sprites' alpha is all
+        # or nothing, so run-length encoding makes their blits several times
+        # cheaper; copies keep the RLE flag off the shared cached surfaces.
+        self.surfaces = []
+        for color in ALIEN_COLORS:
+            surface = load_image(GRAPHICS_DIR / f"{color}.png", ALIEN_SIZE).copy()
+            surface.set_alpha(255, pygame.RLEACCEL)
+            self.surfaces.append(surface)
+        # Indexable by type id, so a frame's surface list is one gather
+        self._surface_table = np.empty(len(self.surfaces), dtype=object)
+        self._surface_table[:] = self.surfaces
+        self.values = np.array([SCORE_VALUES[color] for color in ALIEN_COLORS], dtype=np.int64)
+        self.tests = 0
+
+    def __len__(self) -> int:
+        """Get the number of aliens, including ones killed this tick."""
+        return self.count
+
+    def spawn(self, x: int, y: int, color: str) -> bool:
+        """Add an alien.
+
+        Args:
+            x: X position of the alien's center
+            y: Y position of the alien's center
+            color: Color variant ('red', 'green', or 'yellow')
+
+        Returns:
+            False if the horde is full and the alien was dropped
+        """
+        # Roll the cooldown first so the RNG is used the same way either way
+        cooldown = randint(*ALIEN_LASER_COOLDOWN)
+        if self.count >= self.capacity:
+            return False
+        i = self.count
+        self.x[i] = x - self.width // 2
+        self.y[i] = self.prev_y[i] = y - self.height // 2
+        self.type_ids[i] = ALIEN_COLORS.index(color)
+        self.last_shot[i] = self.clock.get_ticks()
+        self.cooldowns[i] = cooldown
+        self.alive[i] = True
+        self.ids[i] = self._next_id
+        if self.armed:
+            # Fires once more than the cooldown has passed, like Alien.shoot
+            self.scheduler.schedule_at(int(self.last_shot[i]) + cooldown + 1, self._fire, self._next_id)
+        self._next_id += 1
+        self.count += 1
+        return True
+
+    def update(self, dt: float) -> None:
+        """Move every alien down and drop the ones that left the screen.
+
+        Args:
+            dt: Simulation time step in seconds
+        """
+        n = self.count
+        if n == 0:
+            return
+        self.prev_y[:n] = self.y[:n]
+        self.y[:n] += ALIEN_DESCENT_SPEED * dt
+        self.alive[:n] &= self.y[:n].astype(np.int32) < SCREEN_HEIGHT
+        self.compact()
+
+    def compact(self) -> None:
+        """Remove dead aliens, keeping the survivors in spawn order."""
+        n = self.count
+        keep = self.alive[:n]
+        if keep.all():
+            return
+        new_count = int(np.count_nonzero(keep))
+        for array in (self.x, self.y, self.prev_y, self.type_ids, self.last_shot, self.cooldowns, self.ids):
+            array[:new_count] = array[:n][keep]
+        self.alive[:new_count] = True
+        self.alive[new_count:n] = False
+        self.count = new_count
+
+    def collide_rect(self, rect: pygame.Rect) -> np.ndarray:
+        """Find live aliens overlapping a rect.
+
+        Args:
+            rect: Rect to test
+
+        Returns:
+            Indices of the overlapping aliens in spawn order
+        """
+        n = self.count
+        self.tests += n
+        PROFILER.count('collision_tests', n)
+        if n == 0:
+            return np.empty(0, dtype=np.intp)
+        x = self.x[:n]
+        y = self.y[:n].astype(np.int32)
+        hits = (
+            self.alive[:n]
+            & (x < rect.right) & (x + self.width > rect.left)
+            & (y < rect.bottom) & (y + self.height > rect.top)
+        )
+        return np.flatnonzero(hits)
+
+    def collide_rects(self, rects: Sequence[pygame.Rect]) -> List[Tuple[int, np.ndarray]]:
+        """Find the live aliens overlapping each of many rects in one batched grid query.
+
+        Aliens are sorted into SPATIAL_HASH_CELL_SIZE cells by their top-left
+        corner. An alien is no larger than a cell, so a rect can only touch
+        aliens whose corner lies in the cells covering the rect grown by one
+        alien size up and to the left; each such column of cells is one
+        contiguous run of the sorted keys.
+
+        Args:
+            rects: Rects to test
+
+        Returns:
+            (rect index, alien indices in spawn order) for each rect that
+            overlaps any alien, in rect order. Aliens killed after the query
+            are still listed; check their alive flags when resolving hits
+            one rect after another.
+        """
+        n = self.count
+        if n == 0 or not rects:
+            return []
+        size = SPATIAL_HASH_CELL_SIZE
+        stride = self.GRID_STRIDE
+        offset = self.GRID_OFFSET
+        x = self.x[:n]
+        y = self.y[:n].astype(np.int32)
+        keys = (x // size + offset).astype(np.int64) * stride + (y // size + offset)
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+
+        left, top, width, height = np.array(rects, dtype=np.int32).reshape(-1, 4).T
+        right = left + width
+        bottom = top + height
+        first_column = (left - self.width + 1) // size
+        columns = (right - 1) // size - first_column + 1
+        first_row = (top - self.height + 1) // size + offset
+        last_row = (bottom - 1) // size + offset
+
+        # One search range per (rect, column)
+        rect_ids = np.repeat(np.arange(len(left)), columns)
+        column_ids = np.arange(rect_ids.size) - np.repeat(np.cumsum(columns) - columns, columns)
+        base = (first_column[rect_ids] + column_ids + offset).astype(np.int64) * stride
+        starts = np.searchsorted(keys, base + first_row[rect_ids])
+        ends = np.searchsorted(keys, base + last_row[rect_ids], side='right')
+
+        # Expand the ranges into candidate pairs
+        counts = ends - starts
+        total = int(counts.sum())
+        self.tests += total
+        PROFILER.count('collision_tests', total)
+        if total == 0:
+            return []
+        pair_rects = np.repeat(rect_ids, counts)
+        positions = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(starts, counts)
+        pair_aliens = order[positions]
+
+        ax = x[pair_aliens]
+        ay = y[pair_aliens]
+        hits = (
+            self.alive[pair_aliens]
+            & (ax < right[pair_rects]) & (ax + self.width > left[pair_rects])
+            & (ay < bottom[pair_rects]) & (ay + self.height > top[pair_rects])
+        )
+        pair_rects = pair_rects[hits]
+        pair_aliens = pair_aliens[hits]
+        pair_order = np.lexsort((pair_aliens, pair_rects))
+        pair_rects = pair_rects[pair_order]
+        pair_aliens = pair_aliens[pair_order]
+        if pair_rects.size == 0:
+            return []
+        starts = np.flatnonzero(np.r_[True, pair_rects[1:] != pair_rects[:-1]])
+        return list(zip(pair_rects[starts].tolist(), np.split(pair_aliens, starts[1:])))
+
+    def kill(self, indices: np.ndarray) -> int:
+        """Mark aliens as dead.
+
+        Args:
+            indices: Indices returned by collide_rect
+
+        Returns:
+            Total score value of the killed aliens
+        """
+        self.alive[indices] = False
+        return int(self.values[self.type_ids[indices]].sum())
+
+    def centers(self, indices: np.ndarray) -> List[Tuple[int, int]]:
+        """Get the screen centers of aliens.
+
+        Args:
+            indices: Alien indices
+
+        Returns:
+            (x, y) center of each alien
+        """
+        xs = self.x[indices] + self.width // 2
+        ys = self.y[indices].astype(np.int32) + self.height // 2
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    def index_of(self, alien_id: int) -> Optional[int]:
+        """Find the current index of a live alien.
+
+        Args:
+            alien_id: Spawn id of the alien
+
+        Returns:
+            Index into the arrays, or None if the alien is gone
+        """
+        n = self.count
+        i = int(np.searchsorted(self.ids[:n], alien_id))
+        if i < n and self.ids[i] == alien_id and self.alive[i]:
+            return i
+        return None
+
+    def _fire(self, alien_id: int) -> None:
+        """Shot timer callback: fire a laser and schedule the next shot.
+
+        Args:
+            alien_id: Spawn id of the alien whose timer came due
+        """
+        i = self.index_of(alien_id)
+        if i is None:
+            return
+        now = self.clock.get_ticks()
+        self.last_shot[i] = now
+        # Set new random cooldown for next shot
+        cooldown = randint(*ALIEN_LASER_COOLDOWN)
+        self.cooldowns[i] = cooldown
+        self.scheduler.schedule_at(now + cooldown + 1, self._fire, alien_id)
+        center = (int(self.x[i]) + self.width // 2, int(self.y[i]) + self.height // 2)
+        laser = LaserPool().acquire(center, ALIEN_LASER_SPEED, False)
+        if laser is not None:
+            self.lasers.add(laser)
+
+    def clear(self) -> None:
+        """Remove all aliens."""
+        self.alive[:self.count] = False
+        self.count = 0
+
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0) -> None:
+        """Draw every alien in one batched blit.
+
+        Args:
+            screen: Surface to draw on
+            alpha: Fraction of a tick elapsed since the last simulation step,
+                to draw between the previous and current positions
+        """
+        n = self.count
+        if n == 0:
+            return
+        prev_y = self.prev_y[:n].astype(np.int32)
+        y = self.y[:n].astype(np.int32)
+        draw_y = np.rint(prev_y + (y - prev_y) * alpha).astype(np.int32)
+        positions = np.column_stack((self.x[:n], draw_y)).tolist()
+        screen.blits(
+            zip(self._surface_table[self.type_ids[:n]].tolist(), positions),
+            doreturn=False
+        )
+        PROFILER.count('sprites', n)
+        PROFILER.count('blits', n)
@@ -1,37 +1,167 @@
 """Laser projectile entity."""
 
 import pygame
-from typing import Tuple
-from config.settings import SCREEN_HEIGHT, SCREEN_WIDTH, PLAYER_LASER_SIZE, ALIEN_LASER_SIZE
+from typing import Dict, List, Optional, Tuple
+from config.settings import (
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    PLAYER_LASER_SIZE,
+    ALIEN_LASER_SIZE,
+    LASER_POOL_CAPACITY
+)
 
 class Laser(pygame.sprite.Sprite):
     """Laser projectile that can be fired by player or aliens."""
-    
+
     def __init__(self, pos: Tuple[float, float], speed: float, is_player_laser: bool = True):
         """Initialize the laser.
-        
+
         Args:
             pos: Initial (x, y) position
-            speed: Movement speed (negative for upward, positive for downward)
+            speed: Movement speed in pixels per second (negative for upward, positive for downward)
             is_player_laser: Whether this is a player's laser (default: True)
         """
         super().__init__()
-        
-        # Create laser surface with size based on shooter
-        size = PLAYER_LASER_SIZE if is_player_laser else ALIEN_LASER_SIZE
-        self.image = pygame.Surface(size)
-        self.image.fill('cyan' if is_player_laser else 'red')
+        # Set by LaserPool for lasers it owns; killing those returns them to it
+        self.pool: Optional["LaserPool"] = None
+        self.active = True
+        self.reset(pos, speed, is_player_laser)
+
+    def reset(self, pos: Tuple[float, float], speed: float, is_player_laser: bool = True) -> None:
+        """Place the laser and set its type and speed, for a new or reused laser.
+
+        Args:
+            pos: Initial (x, y) position
+            speed: Movement speed in pixels per second
+            is_player_laser: Whether this is a player's laser
+        """
+        self.image = LaserPool.surface(is_player_laser)
         self.rect = self.image.get_rect(center=pos)
-        
+        self.y = float(self.rect.y)
+        self.prev_topleft = self.rect.topleft
+
         self.speed = speed
         self.is_player_laser = is_player_laser
-        
+
+    def kill(self) -> None:
+        """Remove the laser from all groups and return it to its pool."""
+        super().kill()
+        if self.pool is not None and self.active:
+            self.pool.release(self)
+
     def destroy(self):
         """Destroy the laser when it goes off screen."""
         if self.rect.bottom < 0 or self.rect.top > SCREEN_HEIGHT:
             self.kill()
-            
-    def update(self):
-        """Update laser position."""
-        self.rect.y += self.speed
+
+    def update(self, dt: float):
+        """Update laser position.
+
+        Args:
+            dt: Simulation time step in seconds
+        """
+        self.prev_topleft = self.rect.topleft
+        self.y += self.speed * dt
+        self.rect.y = round(self.y)
         self.destroy()
+
+class LaserPool:
+    """Fixed-capacity pool of reusable lasers.
+
+    Killed lasers go back to the free list and are handed out again by
+    acquire(), so once enough lasers exist a session creates no more
+    projectile objects. All lasers of a type share one read-only surface.
+    """
+
+    _instance = None
+    _surfaces: Dict[bool, pygame.Surface] = {}
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        """Initialize an empty pool and counters."""
+        self.capacity = LASER_POOL_CAPACITY
+        self._lasers: List[Laser] = []
+        self._free: List[Laser] = []
+        self.acquired = 0
+        self.released = 0
+        self.exhausted = 0
+
+    @classmethod
+    def surface(cls, is_player_laser: bool) -> pygame.Surface:
+        """Get the shared surface for a laser type.
+
+        Args:
+            is_player_laser: Whether to get the player's or the aliens' laser
+
+        Returns:
+            Shared filled surface
+        """
+        surface = cls._surfaces.get(is_player_laser)
+        if surface is None:
+            size = PLAYER_LASER_SIZE if is_player_laser else ALIEN_LASER_SIZE
+            surface = pygame.Surface(size)
+            surface.fill('cyan' if is_player_laser else 'red')
+            cls._surfaces[is_player_laser] = surface
+        return surface
+
+    def acquire(self, pos: Tuple[float, float], speed: float, is_player_laser: bool = True) -> Optional[Laser]:
+        """Get a laser from the pool, creating one while below capacity.
+
+        Args:
+            pos: Initial (x, y) position
+            speed: Movement speed in pixels per second
+            is_player_laser: Whether this is a player's laser
+
+        Returns:
+            Ready laser, or None if every laser in the pool is in flight
+        """
+        if self._free:
+            laser = self._free.pop()
+            laser.reset(pos, speed, is_player_laser)
+        elif len(self._lasers) < self.capacity:
+            laser = Laser(pos, speed, is_player_laser)
+            laser.pool = self
+            self._lasers.append(laser)
+        else:
+            self.exhausted += 1
+            return None
+        laser.active = True
+        self.acquired += 1
+        return laser
+
+    def release(self, laser: Laser) -> None:
+        """Return a laser to the free list.
+
+        Args:
+            laser: Laser owned by this pool
+        """
+        laser.active = False
+        self._free.append(laser)
+        self.released += 1
+
+    def reclaim(self) -> None:
+        """Kill every laser in flight, returning all of them to the pool."""
+        for laser in self._lasers:
+            if laser.active:
+                laser.kill()
+
+    def stats(self) -> Dict[str, int]:
+        """Get pool counters.
+
+        Returns:
+            Dictionary with allocated, in-use and free laser counts and
+            acquire/release/exhausted totals
+        """
+        return {
+            'allocated': len(self._lasers),
+            'in_use': len(self._lasers) - len(self._free),
+            'free': len(self._free),
+            'acquired': self.acquired,
+            'released': self.released,
+            'exhausted': self.exhausted
+        }
@@ -1,28 +1,114 @@
 """Obstacle protection entities."""
 
-from typing import Tuple
+from typing import Dict, Optional, Tuple
 import pygame
 
-from config.settings import OBSTACLE_BLOCK_SIZE
+from config.settings import OBSTACLE_BLOCK_SIZE, SHIELD_CRATER_RADIUS
+
+class Shield(pygame.sprite.Sprite):
+    """Destructible shield drawn from one surface with a collision mask.
+
+    Damage is stamped into both the image and the mask, so a shield costs
+    one blit to draw and one mask overlap test per collision, regardless of
+    how finely it has been eroded.
+    """
+
+    # Crater masks by radius, shared by every shield
+    _craters: Dict[int, pygame.mask.Mask] = {}
+
+    def __init__(self, image: pygame.Surface, position: Tuple[float, float]):
+        """Initialize shield.
 
-class Block(pygame.sprite.Sprite):
-    """Individual block that makes up an obstacle."""
-    
-    def __init__(self, position: Tuple[float, float], color: Tuple[int, int, int] = (241, 79, 80)):
-        """Initialize block.
-        
         Args:
-            position: Position of the block
-            color: RGB color tuple for the block
+            image: Surface with opaque pixels where the shield is solid
+            position: Top-left position of the shield
         """
         super().__init__()
-        self.image = pygame.Surface((OBSTACLE_BLOCK_SIZE, OBSTACLE_BLOCK_SIZE))
-        self.image.fill(color)
+        self.image = image
         self.rect = self.image.get_rect(topleft=position)
+        self.mask = pygame.mask.from_surface(self.image)
+
+    @classmethod
+    def crater(cls, radius: int) -> pygame.mask.Mask:
+        """Get the mask of a crater, building it on first use.
+
+        Args:
+            radius: Crater radius in pixels
+
+        Returns:
+            Shared mask of a filled circle centered in a (2r+1)-pixel square
+        """
+        mask = cls._craters.get(radius)
+        if mask is None:
+            stamp = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(stamp, 'white', (radius, radius), radius)
+            mask = cls._craters[radius] = pygame.mask.from_surface(stamp)
+        return mask
+
+    def _overlap(self, rect: pygame.Rect) -> Optional[Tuple[int, int]]:
+        """Find a solid shield pixel inside a rect.
+
+        Args:
+            rect: Rect in screen coordinates
+
+        Returns:
+            (x, y) of an overlapping pixel in shield coordinates, or None
+        """
+        if not self.rect.colliderect(rect):
+            return None
+        area = pygame.mask.Mask(rect.size, fill=True)
+        return self.mask.overlap(area, (rect.x - self.rect.x, rect.y - self.rect.y))
+
+    def hit(self, rect: pygame.Rect, radius: int = SHIELD_CRATER_RADIUS, upward: bool = True) -> bool:
+        """Blast a crater where a projectile touches the shield.
+
+        The crater is centered on the projectile's x at its contact row:
+        the bottom-most solid row it overlaps when moving up, the top-most
+        when moving down, which is where it entered the shield.
+
+        Args:
+            rect: Projectile rect in screen coordinates
+            radius: Crater radius in pixels
+            upward: Whether the projectile is moving up the screen
+
+        Returns:
+            True if the projectile hit solid shield
+        """
+        if not self.rect.colliderect(rect):
+            return False
+        area = pygame.mask.Mask(rect.size, fill=True)
+        offset = (rect.x - self.rect.x, rect.y - self.rect.y)
+        contact = self.mask.overlap_mask(area, offset).get_bounding_rects()
+        if not contact:
+            return False
+        if upward:
+            row = max(bounds.bottom for bounds in contact) - 1
+        else:
+            row = min(bounds.top for bounds in contact)
+        center = (rect.centerx - self.rect.x, row)
+        self.mask.erase(self.crater(radius), (center[0] - radius, center[1] - radius))
+        pygame.draw.circle(self.image, (0, 0, 0, 0), center, radius)
+        return True
+
+    def erase(self, rect: pygame.Rect) -> bool:
+        """Remove all shield pixels covered by a rect.
+
+        Args:
+            rect: Rect in screen coordinates
+
+        Returns:
+            True if any solid shield was removed
+        """
+        if self._overlap(rect) is None:
+            return False
+        local = rect.move(-self.rect.x, -self.rect.y)
+        self.mask.erase(pygame.mask.Mask(rect.size, fill=True), local.topleft)
+        self.image.fill((0, 0, 0, 0), local)
+        return True
 
 class Obstacle:
     """Factory class for creating obstacle formations."""
-    
+
     shape = [
         '  xxxxxxx  ',
         ' xxxxxxxxx ',
@@ -32,23 +118,32 @@ class Obstacle:
         'xxx     xxx',
         'xx       xx'
     ]
-    
+
     @classmethod
-    def create(cls, position: Tuple[float, float]) -> pygame.sprite.Group:
+    def create(
+        cls,
+        position: Tuple[float, float],
+        color: Tuple[int, int, int] = (241, 79, 80)
+    ) -> Shield:
         """Create an obstacle formation.
-        
+
         Args:
             position: Base position for the obstacle
-            
+            color: RGB color tuple for the obstacle
+
         Returns:
-            Group of block sprites forming the obstacle
+            Shield sprite shaped like the formation
         """
-        blocks = pygame.sprite.Group()
+        width = len(cls.shape[0]) * OBSTACLE_BLOCK_SIZE
+        height = len(cls.shape) * OBSTACLE_BLOCK_SIZE
+        image = pygame.Surface((width, height), pygame.SRCALPHA)
         for row_index, row in enumerate(cls.shape):
             for col_index, col in enumerate(row):
                 if col == 'x':
-                    x = position[0] + col_index * OBSTACLE_BLOCK_SIZE
-                    y = position[1] + row_index * OBSTACLE_BLOCK_SIZE
-                    block = Block((x, y))
-                    blocks.add(block)
-        return blocks
+                    image.fill(color, (
+                        col_index * OBSTACLE_BLOCK_SIZE,
+                        row_index * OBSTACLE_BLOCK_SIZE,
+                        OBSTACLE_BLOCK_SIZE,
+                        OBSTACLE_BLOCK_SIZE
+                    ))
+        return Shield(image, position)
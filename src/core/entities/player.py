@@ -5,56 +5,68 @@ from typing import Tuple, Optional
 
 from config.settings import (
     GRAPHICS_DIR,
-    AUDIO_DIR,
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
     PLAYER_SPEED,
     PLAYER_LASER_SPEED,
     PLAYER_LASER_COOLDOWN,
-    PLAYER_SIZE,
-    GAME_OPTIONS
+    PLAYER_SIZE
 )
 from core.entities.sprite_entity import SpriteEntity
-from core.entities.laser import Laser
+from core.entities.laser import LaserPool
+from core.utils.sound_manager import SoundManager
+from core.utils.input_state import INPUT
+from core.utils.sim_clock import SimulationClock
 
 class Player(SpriteEntity):
     """Player entity that can move and shoot lasers."""
     
-    def __init__(self, position: Optional[Tuple[float, float]] = None):
+    def __init__(self, position: Optional[Tuple[float, float]] = None, clock: Optional[SimulationClock] = None):
         """Initialize the player.
         
         Args:
             position: Initial (x, y) position of the player. If None, centers at bottom
+            clock: Simulation clock for the shot cooldown, None for a private one
         """
         # Set default position at bottom center
         if position is None:
             position = (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50)
             
-        super().__init__(str(GRAPHICS_DIR / "player.png"), position)
-        
-        # Scale player sprite to new size
-        self.image = pygame.transform.scale(self.image, PLAYER_SIZE)
-        self.rect = self.image.get_rect(center=position)
+        super().__init__(str(GRAPHICS_DIR / "player.png"), position, PLAYER_SIZE)
         
+        self.clock = clock if clock is not None else SimulationClock()
         self.speed = PLAYER_SPEED
+        self.x = float(self.rect.x)
         self.lasers = pygame.sprite.Group()
         self.ready_to_shoot = True
         self.laser_time = 0
         self.laser_cooldown = PLAYER_LASER_COOLDOWN
+        self.sound_manager = SoundManager()
+        
+    def get_input(self, dt: float) -> None:
+        """Handle player input for movement and shooting.
         
-    def get_input(self) -> None:
-        """Handle player input for movement and shooting."""
-        keys = pygame.key.get_pressed()
+        Args:
+            dt: Simulation time step in seconds
+        """
+        keys = INPUT.get_pressed()
         
         # Horizontal movement with screen wrapping
         if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            self.rect.x += self.speed
+            self.x += self.speed * dt
+            self.rect.x = round(self.x)
             if self.rect.left >= SCREEN_WIDTH:
                 self.rect.right = 0
+                self.x = float(self.rect.x)
+                # Don't interpolate across the wrap
+                self.prev_topleft = self.rect.topleft
         elif keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            self.rect.x -= self.speed
+            self.x -= self.speed * dt
+            self.rect.x = round(self.x)
             if self.rect.right <= 0:
                 self.rect.left = SCREEN_WIDTH
+                self.x = float(self.rect.x)
+                self.prev_topleft = self.rect.topleft
             
         # Shooting
         if (keys[pygame.K_SPACE] or keys[pygame.K_UP] or keys[pygame.K_w]) and self.ready_to_shoot:
@@ -62,26 +74,29 @@ class Player(SpriteEntity):
             
     def shoot(self) -> None:
         """Create a laser projectile."""
-        self.lasers.add(Laser(self.rect.center, PLAYER_LASER_SPEED, True))
+        laser = LaserPool().acquire(self.rect.center, PLAYER_LASER_SPEED, True)
+        if laser is None:
+            return
+        self.lasers.add(laser)
         self.ready_to_shoot = False
-        self.laser_time = pygame.time.get_ticks()
-        if GAME_OPTIONS.sound_effects_enabled:
-            pygame.mixer.Sound(str(AUDIO_DIR / "laser.wav")).play()
+        self.laser_time = self.clock.get_ticks()
+        self.sound_manager.play_laser()
             
     def recharge(self) -> None:
         """Recharge laser if cooldown has passed."""
         if not self.ready_to_shoot:
-            current_time = pygame.time.get_ticks()
+            current_time = self.clock.get_ticks()
             if current_time - self.laser_time >= self.laser_cooldown:
                 self.ready_to_shoot = True
                 
-    def update(self) -> None:
-        """Update player state."""
-        self.get_input()
-        self.recharge()
-        self.lasers.update()
+    def update(self, dt: float) -> None:
+        """Update player state.
         
-        # Remove lasers that are off screen
-        for laser in self.lasers:
-            if laser.rect.bottom < 0:
-                laser.kill()
+        Args:
+            dt: Simulation time step in seconds
+        """
+        self.begin_tick()
+        self.get_input(dt)
+        self.recharge()
+        # Lasers kill themselves once off screen
+        self.lasers.update(dt)
@@ -4,26 +4,41 @@ from abc import ABC, abstractmethod
 import pygame
 from typing import Tuple, Optional
 
+from core.utils.asset_cache import load_image
+
 class SpriteEntity(pygame.sprite.Sprite, ABC):
     """Abstract base class for all game entities."""
     
-    def __init__(self, image_path: str, position: Tuple[float, float]):
+    def __init__(
+        self,
+        image_path: str,
+        position: Tuple[float, float],
+        size: Optional[Tuple[int, int]] = None
+    ):
         """Initialize the sprite entity.
         
         Args:
             image_path: Path to the sprite's image file
             position: Initial (x, y) position of the sprite
+            size: Optional (width, height) to scale the image to
         """
         super().__init__()
-        self.image = pygame.image.load(image_path).convert_alpha()
+        # Shared surface from the asset cache, treat as read-only
+        self.image = load_image(image_path, size)
         self.rect = self.image.get_rect(center=position)
         self.position = pygame.math.Vector2(position)
+        # Top-left at the start of the current tick, for render interpolation
+        self.prev_topleft = self.rect.topleft
         
     @abstractmethod
     def update(self, *args, **kwargs) -> None:
         """Update the sprite's state."""
         pass
     
+    def begin_tick(self) -> None:
+        """Remember the current position before the simulation moves the sprite."""
+        self.prev_topleft = self.rect.topleft
+    
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the sprite on the given surface.
         
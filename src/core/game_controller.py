@@ -1,66 +1,356 @@
 """Main game controller."""
 
-import pygame
+import os
 import sys
+import time
 from typing import Optional
 
+import pygame
+
 from core.states.game_state import GameState, GameStateType, GameStateManager
 from core.states.menu_state import MenuState
 from core.states.playing_state import PlayingState
 from core.states.paused_state import PausedState
 from core.states.game_over_state import GameOverState
 from core.states.options_state import OptionsState
+from core.states.loading_state import LoadingState
+from core.effects.crt_effect import CRTEffect
+from core.utils.sound_manager import SoundManager
+from core.utils.dirty_rects import DirtyRectPresenter
+from core.utils.input_state import INPUT
+from core.utils.asset_preloader import AssetPreloader
+from core.utils.replay import ReplayFile, state_checksum
+from core.utils.profiler import PROFILER
+from core.utils.startup import STARTUP
 from config.settings import (
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
+    SCREEN_SIZE,
     FPS,
+    GRAPHICS_DIR,
+    SOUND_EFFECTS,
+    AUDIO_DIR,
+    ASSET_PRELOAD_FRAME_BUDGET,
+    MIXER_BUFFER,
     GAME_OPTIONS
 )
 
 class GameController:
     """Controls the game loop and state transitions."""
     
-    def __init__(self):
-        """Initialize pygame and game states."""
-        pygame.init()
-        pygame.display.set_caption("Space Invaders")
+    def __init__(self, headless: bool = False, seed: Optional[int] = None, record_path: Optional[str] = None):
+        """Initialize pygame and register the game states.
+        
+        States are built on first entry. Sounds, menu fonts and the CRT
+        overlay are decoded on the preloader's threads behind a loading
+        screen; the playing state's assets keep loading while the menu is
+        shown. Each step up to the first frame is timed for the STARTUP
+        report.
+        
+        Args:
+            headless: Use SDL's dummy video and audio drivers so no window or
+                sound device is needed; the display surface is off-screen
+            seed: Seed for the first game, None for a random one
+            record_path: Record the first game to this replay file
+        """
+        self.headless = headless
+        if headless:
+            # Must be set before pygame initializes its subsystems
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+            GAME_OPTIONS.music_enabled = False
+            GAME_OPTIONS.sound_effects_enabled = False
+        with STARTUP.measure("pygame.init"):
+            pygame.mixer.pre_init(buffer=MIXER_BUFFER)
+            pygame.init()
         
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        with STARTUP.measure("display"):
+            pygame.display.set_caption("Space Invaders")
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         self.clock = pygame.time.Clock()
+        
+        self.crt = CRTEffect()
+        self.sounds: Optional[SoundManager] = None
+        self.presenter = DirtyRectPresenter()
+        self._presented_state = None
+        self._presented_crt = GAME_OPTIONS.crt_effect
         self._state_manager = GameStateManager()
+        self._seed = seed
+        self._record_path = record_path
+        
+        # Decode all sound effects up front so gameplay never touches disk
+        self.preloader = AssetPreloader()
+        with STARTUP.measure("queue assets"):
+            for filename, _, _ in SOUND_EFFECTS.values():
+                self.preloader.sound(AUDIO_DIR / filename)
+            self.preloader.defer(self._init_sounds)
+            MenuState.preload(self.preloader)
+            self.preloader.image(GRAPHICS_DIR / 'tv.png', SCREEN_SIZE)
+            if GAME_OPTIONS.crt_effect:
+                self.preloader.defer(lambda: self.crt.get_overlay(SCREEN_SIZE))
+            loading_jobs = self.preloader.queued
+            # Prewarmed while the menu is up so starting a game doesn't stall
+            PlayingState.preload(self.preloader)
         
-        # Register all game states
-        self._state_manager.register_state(GameStateType.MENU, MenuState())
-        self._state_manager.register_state(GameStateType.PLAYING, PlayingState())
-        self._state_manager.register_state(GameStateType.PAUSED, PausedState())
-        self._state_manager.register_state(GameStateType.GAME_OVER, GameOverState())
-        self._state_manager.register_state(GameStateType.OPTIONS, OptionsState())
+        # Register all game states; each is built the first time it's entered
+        manager = self._state_manager
+        manager.register_factory(
+            GameStateType.LOADING,
+            lambda: LoadingState(self.preloader, loading_jobs)
+        )
+        manager.register_factory(GameStateType.MENU, MenuState)
+        manager.register_factory(GameStateType.PLAYING, self._build_playing_state)
+        manager.register_factory(GameStateType.PAUSED, PausedState)
+        manager.register_factory(GameStateType.GAME_OVER, GameOverState)
+        manager.register_factory(GameStateType.OPTIONS, OptionsState)
         
         # Set initial state
-        self._state_manager.switch_state(GameStateType.MENU)
+        manager.switch_state(GameStateType.LOADING)
+        
+    def _init_sounds(self) -> None:
+        """Create the sound bank once its effects have been decoded."""
+        self.sounds = SoundManager()
+        
+    def _build_playing_state(self) -> PlayingState:
+        """Create the playing state, recording its first game if requested.
+        
+        Assets still queued on the preloader are finished first.
+        
+        Returns:
+            New playing state
+        """
+        self.preloader.wait()
+        state = PlayingState(self._seed, clock=self._state_manager.clock)
+        if self._record_path:
+            state.start_recording(self._record_path)
+        return state
+        
+    @property
+    def playing_state(self) -> PlayingState:
+        """Get the playing state, building it on first use."""
+        return self._state_manager.get_state(GameStateType.PLAYING)
         
     def run(self) -> None:
         """Run the main game loop."""
         while True:
             dt = self.clock.tick(FPS) / 1000.0  # Convert to seconds
+            PROFILER.begin_frame()
+            t = PROFILER.start()
+            
+            # Finish assets decoded in the background, within a time budget
+            self.preloader.poll(ASSET_PRELOAD_FRAME_BUDGET)
+            t = PROFILER.record('assets', t)
             
             # Handle events
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
+                    self.quit()
+                    
+                if event.type == pygame.KEYDOWN and event.key in (pygame.K_F3, pygame.K_F5, pygame.K_F6):
+                    self.handle_debug_key(event.key)
+                    continue
                     
                 # Let current state handle the event
                 self._state_manager.handle_event(event)
+            t = PROFILER.record('events', t)
                 
             # Update and draw current state
             self._state_manager.update(dt)
+            t = PROFILER.record('update', t)
+            
+            # Start the sounds requested by this frame's ticks in one batch
+            if self.sounds:
+                self.sounds.flush()
+                t = PROFILER.record('sounds', t)
             
             # Clear screen
             self.screen.fill((0, 0, 0))
             
             # Draw current state
             self._state_manager.draw(self.screen)
+            t = PROFILER.record('draw', t)
+            
+            # Apply CRT overlay on top of everything
+            if GAME_OPTIONS.crt_effect:
+                self.crt.draw(self.screen)
+                t = PROFILER.record('crt', t)
             
             # Update display
-            pygame.display.flip()
+            if PROFILER.enabled:
+                PROFILER.draw(self.screen)
+                self.presenter.invalidate()
+                t = PROFILER.start()
+            self.present()
+            PROFILER.record('present', t)
+            STARTUP.finish()
+            
+    def handle_debug_key(self, key: int) -> None:
+        """Handle the profiler and simulation stepping hotkeys.
+        
+        F3 toggles the profiler, F5 freezes or unfreezes the simulation and
+        F6 advances a frozen simulation by exactly one tick.
+        
+        Args:
+            key: Pressed key
+        """
+        manager = self._state_manager
+        if key == pygame.K_F3:
+            PROFILER.toggle()
+            self.presenter.invalidate()
+        elif key == pygame.K_F5:
+            manager.paused = not manager.paused
+        elif key == pygame.K_F6 and manager.paused:
+            manager.tick()
+            
+    def set_time_scale(self, scale: float) -> None:
+        """Run the simulation slower or faster than real time.
+        
+        Args:
+            scale: Simulated seconds per real second
+        """
+        self._state_manager.set_time_scale(scale)
+        
+    def quit(self) -> None:
+        """Finish recordings and profiler output, then exit."""
+        self.preloader.shutdown()
+        if self._state_manager.is_built(GameStateType.PLAYING):
+            self.playing_state.stop_recording()
+        self.dump_profile()
+        pygame.quit()
+        sys.exit()
+        
+    def dump_profile(self) -> None:
+        """Write recorded profiler frames to CSV, if the profiler was used."""
+        path = PROFILER.dump_csv()
+        if path:
+            print(f"Profiler data written to {path}")
+            
+    def present(self) -> None:
+        """Push the frame to the display, limited to dirty regions when possible."""
+        state = self._state_manager.current_state
+        # A new state or a CRT toggle changes pixels the state doesn't know about
+        if state is not self._presented_state or GAME_OPTIONS.crt_effect != self._presented_crt:
+            self._presented_state = state
+            self._presented_crt = GAME_OPTIONS.crt_effect
+            self.presenter.invalidate()
+        self.presenter.present(self._state_manager.get_dirty_rects())
+        
+    def run_headless(
+        self,
+        max_frames: Optional[int] = None,
+        max_games: Optional[int] = None,
+        fixed_step: bool = True,
+        render: bool = True
+    ) -> None:
+        """Run the game loop without a frame cap until a frame or game limit.
+        
+        Starts straight in the playing state and restarts it after every
+        game over. Prints frames, ticks and ticks per second on exit.
+        
+        Args:
+            max_frames: Stop after this many frames, None for no limit
+            max_games: Stop after this many finished games, None for no limit
+            fixed_step: Advance exactly one simulation tick per frame instead
+                of following the wall clock
+            render: Draw each frame to the off-screen display surface
+        """
+        manager = self._state_manager
+        playing_state = self.playing_state
+        manager.switch_state(GameStateType.PLAYING)
+        
+        frames = 0
+        games = 0
+        start_ticks = manager.ticks
+        start = time.perf_counter()
+        try:
+            while max_frames is None or frames < max_frames:
+                PROFILER.begin_frame()
+                t = PROFILER.start()
+                # Keep SDL's event queue drained
+                pygame.event.pump()
+                t = PROFILER.record('events', t)
+                dt = manager.step if fixed_step else self.clock.tick() / 1000.0
+                manager.update(dt)
+                t = PROFILER.record('update', t)
+                if self.sounds:
+                    self.sounds.flush()
+                    t = PROFILER.record('sounds', t)
+                
+                if render:
+                    self.screen.fill((0, 0, 0))
+                    manager.draw(self.screen)
+                    PROFILER.record('draw', t)
+                STARTUP.finish()
+                frames += 1
+                
+                if manager.current_state_type == GameStateType.GAME_OVER:
+                    games += 1
+                    if max_games is not None and games >= max_games:
+                        break
+                    playing_state.reset_game()
+                    manager.switch_state(GameStateType.PLAYING)
+        finally:
+            playing_state.stop_recording()
+            self.dump_profile()
+            elapsed = time.perf_counter() - start
+            ticks = manager.ticks - start_ticks
+            rate = ticks / elapsed if elapsed > 0 else 0.0
+            print(
+                f"Headless run: {frames} frames, {ticks} ticks, {games} games "
+                f"in {elapsed:.2f}s ({rate:.0f} ticks/s)"
+            )
+            
+    def run_replay(self, path: str, render: bool = False) -> bool:
+        """Re-run a replay file as fast as possible and verify it.
+        
+        The recorded game is reset with the replay's seed and fed its
+        inputs one tick at a time. The state checksum is compared at every
+        keyframe and after the last tick; the first mismatch stops the run.
+        
+        Args:
+            path: Replay file path
+            render: Draw each tick to the off-screen display surface
+            
+        Returns:
+            True if every checksum matched
+        """
+        replay = ReplayFile(path)
+        manager = self._state_manager
+        manager.step = 1.0 / replay.tick_rate
+        self.playing_state.stop_recording()
+        self.playing_state.reset_game(replay.seed)
+        manager.switch_state(GameStateType.PLAYING)
+        
+        ticks = 0
+        checked = 0
+        mismatch = None
+        start = time.perf_counter()
+        for mask in replay.inputs():
+            # Ticks spent paused were not recorded
+            if manager.current_state_type != GameStateType.PLAYING:
+                manager.switch_state(GameStateType.PLAYING)
+            INPUT.feed(mask)
+            manager.tick()
+            ticks += 1
+            if render:
+                manager.draw(self.screen)
+            expected = replay.checksums.get(ticks)
+            if expected is not None:
+                checked += 1
+                if state_checksum(self.playing_state) != expected:
+                    mismatch = ticks
+                    break
+        elapsed = time.perf_counter() - start
+        rate = ticks / elapsed if elapsed > 0 else 0.0
+        
+        if mismatch is not None:
+            print(f"Replay {path}: checksum mismatch at tick {mismatch}")
+            return False
+        if ticks != replay.total_ticks:
+            print(f"Replay {path}: ended after {ticks} of {replay.total_ticks} ticks")
+            return False
+        print(
+            f"Replay {path}: {ticks} ticks verified at {checked} checkpoints "
+            f"in {elapsed:.2f}s ({rate:.0f} ticks/s)"
+        )
+        return True
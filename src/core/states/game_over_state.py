@@ -1,16 +1,18 @@
 """Game over state module."""
 
 import pygame
-from typing import Optional
+from typing import Optional, List
 
 from core.states.game_state import GameState, GameStateType
+from core.ui.font_registry import get_font
+from core.utils.input_state import INPUT
+from core.utils.music_player import MusicPlayer
 from config.settings import (
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
     FONT_SIZE,
     FONT_NAME,
-    WHITE,
-    GAME_OPTIONS
+    WHITE
 )
 
 class GameOverState(GameState):
@@ -24,7 +26,15 @@ class GameOverState(GameState):
         """
         super().__init__()
         self.final_score = final_score
-        self.font = pygame.font.SysFont(FONT_NAME, FONT_SIZE)
+        self.font = get_font(FONT_NAME, FONT_SIZE)
+        
+        # Static text is rendered once; the score line only when it changes
+        self.game_over_text = self.font.render("GAME OVER", True, WHITE)
+        self.restart_text = self.font.render("Press SPACE to restart", True, WHITE)
+        self.menu_text = self.font.render("Press ESC for menu", True, WHITE)
+        self._score_text = None
+        self._rendered_score = None
+        self._score_changed = True
         
     def update(self, dt: float) -> Optional[GameStateType]:
         """Update game over state.
@@ -35,13 +45,12 @@ class GameOverState(GameState):
         Returns:
             New game state if needed
         """
-        keys = pygame.key.get_pressed()
+        keys = INPUT.get_pressed()
         
         # Check for restart or quit
         if keys[pygame.K_SPACE]:
-            # Stop any playing music before transitioning
-            if GAME_OPTIONS.music_enabled and pygame.mixer.music.get_busy():
-                pygame.mixer.music.stop()
+            # Stop the music; the next game restarts it
+            MusicPlayer().stop()
             return GameStateType.PLAYING
             
         if keys[pygame.K_ESCAPE]:
@@ -59,19 +68,27 @@ class GameOverState(GameState):
         screen.fill((0, 0, 0))
         
         # Draw game over text
-        game_over_text = self.font.render("GAME OVER", True, WHITE)
-        score_text = self.font.render(f"Final Score: {self.final_score}", True, WHITE)
-        restart_text = self.font.render("Press SPACE to restart", True, WHITE)
-        menu_text = self.font.render("Press ESC for menu", True, WHITE)
+        self._score_changed = self._rendered_score != self.final_score
+        if self._score_changed:
+            self._rendered_score = self.final_score
+            self._score_text = self.font.render(f"Final Score: {self.final_score}", True, WHITE)
         
         # Position text
-        game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 60))
-        score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60))
-        menu_rect = menu_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100))
+        game_over_rect = self.game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 60))
+        score_rect = self._score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        restart_rect = self.restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60))
+        menu_rect = self.menu_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100))
         
         # Draw text
-        screen.blit(game_over_text, game_over_rect)
-        screen.blit(score_text, score_rect)
-        screen.blit(restart_text, restart_rect)
-        screen.blit(menu_text, menu_rect)
+        screen.blit(self.game_over_text, game_over_rect)
+        screen.blit(self._score_text, score_rect)
+        screen.blit(self.restart_text, restart_rect)
+        screen.blit(self.menu_text, menu_rect)
+        
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """Get the screen regions changed by the last draw.
+        
+        Returns:
+            Empty list while the screen is static, None after the score changed
+        """
+        return None if self._score_changed else []
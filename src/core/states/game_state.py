@@ -1,8 +1,15 @@
 """Game state management."""
 
+import math
 import pygame
 from enum import Enum, auto
-from typing import Optional, Dict
+from typing import Callable, Optional, Dict, List
+
+from config.settings import SIMULATION_RATE, MAX_SIMULATION_STEPS
+from core.utils.input_state import INPUT
+from core.utils.asset_preloader import AssetPreloader
+from core.utils.sim_clock import SimulationClock
+from core.utils.startup import STARTUP
 
 class GameStateType(Enum):
     """Available game states."""
@@ -12,10 +19,25 @@ class GameStateType(Enum):
     GAME_OVER = auto()
     VICTORY = auto()
     OPTIONS = auto()
+    LOADING = auto()
 
 class GameState:
     """Base class for game states."""
     
+    # Fraction of a simulation tick elapsed at draw time, set by GameStateManager
+    interpolation: float = 0.0
+    # Whether ticks of this state advance the simulation clock
+    advances_clock: bool = False
+    
+    @classmethod
+    def preload(cls, preloader: AssetPreloader) -> None:
+        """Queue the assets the state loads when built.
+        
+        Args:
+            preloader: Preloader to queue the assets on
+        """
+        pass
+        
     def handle_event(self, event: pygame.event.Event) -> Optional[GameStateType]:
         """Handle pygame events.
         
@@ -45,20 +67,42 @@ class GameState:
             screen: Surface to draw on
         """
         pass
+        
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """Get the screen regions changed by the last draw.
+        
+        Returns:
+            List of changed rects, or None if the whole screen may have changed
+        """
+        return None
 
 class GameStateManager:
     """Manages game states and transitions."""
     
-    def __init__(self, initial_state: GameStateType = GameStateType.MENU):
+    def __init__(
+        self,
+        initial_state: GameStateType = GameStateType.MENU,
+        clock: Optional[SimulationClock] = None
+    ):
         """Initialize the state manager.
         
         Args:
             initial_state: Initial game state
+            clock: Simulation clock to drive, None to create one
         """
         self._states: Dict[GameStateType, GameState] = {}
+        self._factories: Dict[GameStateType, Callable[[], GameState]] = {}
         self._current_state: Optional[GameState] = None
         self._current_state_type: Optional[GameStateType] = initial_state
         
+        # Fixed-timestep simulation
+        self.step = 1.0 / SIMULATION_RATE
+        self.time_scale = 1.0
+        self.paused = False
+        self._accumulator = 0.0
+        self.ticks = 0
+        self.clock = clock if clock is not None else SimulationClock()
+        
     def register_state(self, state_type: GameStateType, state: GameState) -> None:
         """Register a state with the manager.
         
@@ -66,18 +110,71 @@ class GameStateManager:
             state_type: Type of state to register
             state: State instance
         """
+        self._factories.pop(state_type, None)
         self._states[state_type] = state
         if state_type == self._current_state_type:
             self._current_state = state
             
+    @property
+    def current_state(self) -> Optional[GameState]:
+        """Get the active state instance."""
+        return self._current_state
+            
+    @property
+    def current_state_type(self) -> Optional[GameStateType]:
+        """Get the active state type."""
+        return self._current_state_type
+            
+    def register_factory(self, state_type: GameStateType, factory: Callable[[], GameState]) -> None:
+        """Register a state that is only built when first needed.
+        
+        The factory runs on the first switch_state() or get_state() for the
+        type, so states the player never enters cost nothing at startup.
+        Build times are reported to STARTUP.
+        
+        Args:
+            state_type: Type of state to register
+            factory: Callable returning the state instance
+        """
+        self._states.pop(state_type, None)
+        self._factories[state_type] = factory
+        
+    def is_built(self, state_type: GameStateType) -> bool:
+        """Check whether a state instance exists without building it.
+        
+        Args:
+            state_type: Type of state to check
+            
+        Returns:
+            True if the state was registered as an instance or already built
+        """
+        return state_type in self._states
+            
+    def get_state(self, state_type: GameStateType) -> Optional[GameState]:
+        """Get a registered state by type, building it if it is lazy.
+        
+        Args:
+            state_type: Type of state to get
+            
+        Returns:
+            State instance if registered
+        """
+        state = self._states.get(state_type)
+        if state is None and state_type in self._factories:
+            with STARTUP.measure(f"state {state_type.name.lower()}"):
+                state = self._factories.pop(state_type)()
+            self._states[state_type] = state
+        return state
+            
     def switch_state(self, state_type: GameStateType) -> None:
         """Switch to a different state.
         
         Args:
             state_type: Type of state to switch to
         """
-        if state_type in self._states:
-            self._current_state = self._states[state_type]
+        state = self.get_state(state_type)
+        if state is not None:
+            self._current_state = state
             self._current_state_type = state_type
             
     def handle_event(self, event: pygame.event.Event) -> None:
@@ -91,14 +188,53 @@ class GameStateManager:
             if new_state:
                 self.switch_state(new_state)
                 
+    def set_time_scale(self, scale: float) -> None:
+        """Run the simulation slower or faster than real time.
+        
+        The tick length stays fixed; scaling changes how many ticks a
+        frame runs, so a scaled game plays out exactly like an unscaled one.
+        
+        Args:
+            scale: Simulated seconds per real second, e.g. 4.0 to fast-forward
+        """
+        self.time_scale = max(0.0, scale)
+        
     def update(self, dt: float) -> None:
-        """Update current state.
+        """Advance the simulation by whole fixed ticks covering the elapsed time.
+        
+        Leftover time carries over to the next frame and sets the render
+        interpolation factor. Time beyond MAX_SIMULATION_STEPS ticks (times
+        the time scale when fast-forwarding) is dropped so a long stall
+        can't snowball into ever longer frames. Nothing advances while the
+        manager is paused; tick() still steps one tick at a time.
         
         Args:
-            dt: Delta time since last update
+            dt: Real time since last update in seconds
         """
+        if self.paused:
+            return
+        self._accumulator += dt * self.time_scale
+        max_steps = MAX_SIMULATION_STEPS * max(1, math.ceil(self.time_scale))
+        steps = 0
+        while self._accumulator >= self.step:
+            if steps >= max_steps:
+                self._accumulator = 0.0
+                break
+            self.tick()
+            self._accumulator -= self.step
+            steps += 1
+        if self._current_state:
+            self._current_state.interpolation = self._accumulator / self.step
+                
+    def tick(self) -> None:
+        """Run one fixed simulation step of the current state."""
+        self.ticks += 1
+        # Keyboard state is sampled once per tick so every reader sees the same input
+        INPUT.begin_tick()
         if self._current_state:
-            new_state = self._current_state.update(dt)
+            if self._current_state.advances_clock:
+                self.clock.advance(self.step)
+            new_state = self._current_state.update(self.step)
             if new_state:
                 self.switch_state(new_state)
                 
@@ -110,6 +246,16 @@ class GameStateManager:
         """
         if self._current_state:
             self._current_state.draw(screen)
+            
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """Get the regions changed by the current state's last draw.
+        
+        Returns:
+            List of changed rects, or None if the whole screen may have changed
+        """
+        if self._current_state:
+            return self._current_state.get_dirty_rects()
+        return None
 
 # Global state manager instance
 _state_manager = GameStateManager(GameStateType.MENU)
@@ -0,0 +1,88 @@
+"""Loading screen state."""
+
+import math
+import time
+import pygame
+from typing import Optional
+
+from core.states.game_state import GameState, GameStateType
+from core.utils.asset_preloader import AssetPreloader
+from core.utils.startup import STARTUP
+from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE
+
+BAR_SIZE = (400, 12)
+BLOCK_COUNT = 8
+
+class LoadingState(GameState):
+    """Animated progress screen shown while the preloader works.
+
+    Draws only rects so it needs no assets itself. The preloader is polled
+    by the game loop; this state just watches its progress and moves on to
+    the menu once the jobs it waits for are finished.
+    """
+
+    def __init__(self, preloader: AssetPreloader, jobs: int, next_state: GameStateType = GameStateType.MENU):
+        """Initialize the loading screen.
+
+        Args:
+            preloader: Preloader doing the loading
+            jobs: Number of preloader jobs to wait for; jobs queued after
+                them keep loading in the background
+            next_state: State to switch to when loading is done
+        """
+        super().__init__()
+        self.preloader = preloader
+        self.jobs = jobs
+        self.next_state = next_state
+        self.time = 0.0
+        self._started = time.perf_counter()
+        self.bar_rect = pygame.Rect((0, 0), BAR_SIZE)
+        self.bar_rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+
+    @property
+    def progress(self) -> float:
+        """Get the fraction of the awaited jobs that are finished."""
+        if self.jobs <= 0:
+            return 1.0
+        return min(self.preloader.finished, self.jobs) / self.jobs
+
+    def update(self, dt: float) -> Optional[GameStateType]:
+        """Advance the animation and leave once loading is done.
+
+        Args:
+            dt: Time delta in seconds
+
+        Returns:
+            Next state once the awaited jobs are finished
+        """
+        self.time += dt
+        if self.preloader.finished >= self.jobs:
+            STARTUP.add("loading screen", time.perf_counter() - self._started)
+            return self.next_state
+        return None
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """Draw the progress bar and a row of pulsing blocks.
+
+        Args:
+            screen: Surface to draw on
+        """
+        screen.fill((0, 0, 0))
+        bar = self.bar_rect
+        pygame.draw.rect(screen, WHITE, bar.inflate(8, 8), 2)
+        fill = bar.copy()
+        fill.width = int(bar.width * self.progress)
+        if fill.width:
+            pygame.draw.rect(screen, WHITE, fill)
+
+        # A brightness wave runs along the blocks while loading continues
+        block = BAR_SIZE[1]
+        spacing = block * 2
+        left = bar.centerx - (BLOCK_COUNT * spacing - block) // 2
+        for i in range(BLOCK_COUNT):
+            level = int(127 + 128 * math.sin(self.time * 6.0 - i * 0.8))
+            pygame.draw.rect(
+                screen,
+                (level, level, level),
+                (left + i * spacing, bar.bottom + 30, block, block)
+            )
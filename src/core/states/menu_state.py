@@ -4,21 +4,27 @@ import pygame
 from typing import Optional, List, Tuple
 
 from core.states.game_state import GameState, GameStateType
-from config.settings import (
-    SCREEN_WIDTH,
-    SCREEN_HEIGHT,
-    FONT_DIR,
-    MENU_FONT_SIZE,
-    GAME_OPTIONS
-)
+from core.ui.menu_renderer import MenuRenderer, MENU_FONT_NAME
+from core.utils.asset_preloader import AssetPreloader
+from core.utils.music_player import MusicPlayer
+from config.settings import MENU_FONT_SIZE
 
 class MenuState(GameState):
     """Main menu state."""
     
+    @classmethod
+    def preload(cls, preloader: AssetPreloader) -> None:
+        """Queue the menu fonts.
+        
+        Args:
+            preloader: Preloader to queue the assets on
+        """
+        for size in (MENU_FONT_SIZE, MENU_FONT_SIZE * 2, MENU_FONT_SIZE // 2):
+            preloader.font(MENU_FONT_NAME, size)
+        
     def __init__(self):
         """Initialize menu state."""
         super().__init__()
-        self.font = pygame.font.Font(str(FONT_DIR / "Pixeled.ttf"), MENU_FONT_SIZE)
         self.selected_option = 0
         self.options = [
             ("START GAME", GameStateType.PLAYING),
@@ -26,12 +32,8 @@ class MenuState(GameState):
             ("QUIT", None)  # Will exit game
         ]
         
-        # Title setup
-        title_font = pygame.font.Font(str(FONT_DIR / "Pixeled.ttf"), MENU_FONT_SIZE * 2)
-        self.title_surf = title_font.render("SPACE INVADERS", False, 'white')
-        self.title_rect = self.title_surf.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4)
-        )
+        # Title, options and credits are rendered once and cached
+        self.renderer = MenuRenderer("SPACE INVADERS", MENU_FONT_SIZE * 2)
         
     def handle_event(self, event: pygame.event.Event) -> Optional[GameStateType]:
         """Handle pygame events.
@@ -50,6 +52,8 @@ class MenuState(GameState):
             elif event.key in (pygame.K_SPACE, pygame.K_RETURN):
                 option_text, action = self.options[self.selected_option]
                 if action:
+                    # Continue the music of a game left through the pause menu
+                    MusicPlayer().resume()
                     return action
                 elif option_text == "OPTIONS":
                     return GameStateType.OPTIONS
@@ -65,26 +69,12 @@ class MenuState(GameState):
         Args:
             screen: Surface to draw on
         """
-        # Draw background
-        screen.fill((0, 0, 0))
+        self.renderer.draw(screen, [text for text, _ in self.options], self.selected_option)
         
-        # Draw title
-        screen.blit(self.title_surf, self.title_rect)
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """Get the screen regions changed by the last draw.
         
-        # Draw menu options
-        for i, (text, _) in enumerate(self.options):
-            color = 'yellow' if i == self.selected_option else 'white'
-            text_surf = self.font.render(text, False, color)
-            text_rect = text_surf.get_rect(
-                center=(SCREEN_WIDTH // 2, 
-                       SCREEN_HEIGHT // 2 + i * 50)
-            )
-            screen.blit(text_surf, text_rect)
-            
-        # Draw credits at the bottom
-        credits_font = pygame.font.Font(str(FONT_DIR / "Pixeled.ttf"), MENU_FONT_SIZE // 2)
-        credits_surf = credits_font.render("Game by Josue Barros - 2025", False, 'white')
-        credits_rect = credits_surf.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30)
-        )
-        screen.blit(credits_surf, credits_rect)
+        Returns:
+            Changed option rows, or None after a full re-render
+        """
+        return self.renderer.dirty_rects
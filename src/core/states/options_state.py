@@ -1,16 +1,12 @@
 """Options menu state."""
 
 import pygame
-from typing import Optional
+from typing import Optional, List
 
 from core.states.game_state import GameState, GameStateType
-from config.settings import (
-    SCREEN_WIDTH,
-    SCREEN_HEIGHT,
-    FONT_DIR,
-    MENU_FONT_SIZE,
-    GAME_OPTIONS
-)
+from core.ui.menu_renderer import MenuRenderer
+from core.utils.music_player import MusicPlayer
+from config.settings import GAME_OPTIONS
 
 class OptionsState(GameState):
     """Options menu state."""
@@ -18,7 +14,7 @@ class OptionsState(GameState):
     def __init__(self):
         """Initialize options state."""
         super().__init__()
-        self.font = pygame.font.Font(str(FONT_DIR / "Pixeled.ttf"), MENU_FONT_SIZE)
+        self.renderer = MenuRenderer("OPTIONS")
         self.selected_option = 0
         self._update_options()
         
@@ -60,6 +56,7 @@ class OptionsState(GameState):
                     GAME_OPTIONS.toggle_crt()
                 elif self.selected_option == 1:  # Music
                     GAME_OPTIONS.toggle_music()
+                    MusicPlayer().apply_options()
                 elif self.selected_option == 2:  # Sound Effects
                     GAME_OPTIONS.toggle_sound_effects()
                 elif self.selected_option == 3:  # Fullscreen
@@ -79,28 +76,12 @@ class OptionsState(GameState):
         Args:
             screen: Surface to draw on
         """
-        # Draw background
-        screen.fill((0, 0, 0))
+        self.renderer.draw(screen, [text for text, _ in self.options], self.selected_option)
         
-        # Draw title
-        title_surf = self.font.render("OPTIONS", False, 'white')
-        title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4))
-        screen.blit(title_surf, title_rect)
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """Get the screen regions changed by the last draw.
         
-        # Draw options
-        for i, (text, _) in enumerate(self.options):
-            color = 'yellow' if i == self.selected_option else 'white'
-            text_surf = self.font.render(text, False, color)
-            text_rect = text_surf.get_rect(
-                center=(SCREEN_WIDTH // 2, 
-                       SCREEN_HEIGHT // 2 + i * 50)
-            )
-            screen.blit(text_surf, text_rect)
-            
-        # Draw credits
-        credits_font = pygame.font.Font(str(FONT_DIR / "Pixeled.ttf"), MENU_FONT_SIZE // 2)
-        credits_surf = credits_font.render("Game by Josue Barros - 2025", False, 'white')
-        credits_rect = credits_surf.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30)
-        )
-        screen.blit(credits_surf, credits_rect)
+        Returns:
+            Changed option rows, or None after a full re-render
+        """
+        return self.renderer.dirty_rects
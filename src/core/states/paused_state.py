@@ -3,21 +3,18 @@
 import pygame
 from typing import Optional, List, Tuple
 
-from core.states.game_state import GameState, GameStateType, get_game_state
-from config.settings import (
-    SCREEN_WIDTH,
-    SCREEN_HEIGHT,
-    FONT_DIR,
-    MENU_FONT_SIZE,
-    GAME_OPTIONS
-)
+from core.states.game_state import GameState, GameStateType
+from core.ui.menu_renderer import MenuRenderer
+from core.utils.music_player import MusicPlayer
+from config.settings import GAME_OPTIONS
 
 class PausedState(GameState):
     """State when game is paused with options menu."""
     
     def __init__(self):
         """Initialize pause menu state."""
-        self.font = pygame.font.Font(str(FONT_DIR / "Pixeled.ttf"), MENU_FONT_SIZE)
+        # Darken whatever is behind the menu
+        self.renderer = MenuRenderer("PAUSED", background=(0, 0, 0, 128))
         self.selected_option = 0
         self.options = [
             ("RESUME", GameStateType.PLAYING),
@@ -43,10 +40,11 @@ class PausedState(GameState):
         
         if action == GameStateType.PLAYING:
             # Resume music when unpausing
-            playing_state = get_game_state(GameStateType.PLAYING)
-            playing_state.resume_game()
+            MusicPlayer().resume()
             return action
         elif action:
+            # The game stays as it is behind the menu, so keep its track's position
+            MusicPlayer().pause()
             return action
             
         # Handle toggles
@@ -54,6 +52,7 @@ class PausedState(GameState):
             GAME_OPTIONS.toggle_crt()
         elif self.selected_option == 2:  # Music
             GAME_OPTIONS.toggle_music()
+            MusicPlayer().apply_options()
         elif self.selected_option == 3:  # Sound Effects
             GAME_OPTIONS.toggle_sound_effects()
             
@@ -69,8 +68,7 @@ class PausedState(GameState):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 # Resume music when unpausing with ESC
-                playing_state = get_game_state(GameStateType.PLAYING)
-                playing_state.resume_game()
+                MusicPlayer().resume()
                 return GameStateType.PLAYING
             elif event.key in (pygame.K_w, pygame.K_UP):
                 self.selected_option = (self.selected_option - 1) % len(self.options)
@@ -98,31 +96,12 @@ class PausedState(GameState):
         Args:
             screen: Surface to draw on
         """
-        # Darken the background
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(128)
-        screen.blit(overlay, (0, 0))
+        self.renderer.draw(screen, [text for text, _ in self.options], self.selected_option)
         
-        # Draw menu title
-        title_surf = self.font.render("PAUSED", False, 'white')
-        title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4))
-        screen.blit(title_surf, title_rect)
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """Get the screen regions changed by the last draw.
         
-        # Draw menu options
-        for i, (text, _) in enumerate(self.options):
-            color = 'yellow' if i == self.selected_option else 'white'
-            text_surf = self.font.render(text, False, color)
-            text_rect = text_surf.get_rect(
-                center=(SCREEN_WIDTH // 2, 
-                       SCREEN_HEIGHT // 2 + i * 50)
-            )
-            screen.blit(text_surf, text_rect)
-            
-        # Draw credits at the bottom
-        credits_font = pygame.font.Font(str(FONT_DIR / "Pixeled.ttf"), MENU_FONT_SIZE // 2)
-        credits_surf = credits_font.render("Game by Josue Barros - 2025", False, 'white')
-        credits_rect = credits_surf.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30)
-        )
-        screen.blit(credits_surf, credits_rect)
+        Returns:
+            Changed option rows, or None after a full re-render
+        """
+        return self.renderer.dirty_rects
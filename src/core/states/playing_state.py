@@ -1,94 +1,157 @@
 """Playing state module."""
 
+import random
 import pygame
 from random import randint, choice
 from typing import Optional, Tuple
 
 from core.states.game_state import GameState, GameStateType
 from core.entities.player import Player
-from core.entities.alien import Alien, Extra
-from core.effects.particle_system import ParticleSystem
+from core.entities.alien import Extra
+from core.entities.alien_horde import AlienHorde, ALIEN_COLORS
+from core.entities.laser import LaserPool
+from core.effects.explosion_flipbook import EffectManager, FlipbookCache
 from core.effects.starfield import StarField
 from core.ui.score_display import ScoreDisplay
 from core.ui.lives_display import LivesDisplay
+from core.ui.glyph_atlas import GlyphAtlas, HUD_STATS
+from core.utils.interpolation import draw_interpolated
+from core.utils.input_state import INPUT
+from core.utils.sim_clock import SimulationClock
+from core.utils.scheduler import TimerScheduler
+from core.utils.replay import ReplayRecorder
+from core.utils.profiler import PROFILER
+from core.utils.sound_manager import SoundManager
+from core.utils.music_player import MusicPlayer
+from core.utils.asset_preloader import AssetPreloader
 from config.settings import (
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
+    GRAPHICS_DIR,
+    PLAYER_SIZE,
+    ALIEN_SIZE,
+    SCORE_FONT_SIZE,
     PLAYER_LIVES,
     EXTRA_SPAWN_TIME_MIN,
     EXTRA_SPAWN_TIME_MAX,
     ALIEN_MIN_SPAWN_COUNT,
     ALIEN_MAX_SPAWN_COUNT,
     ALIEN_SPAWN_DELAY,
+    ALIEN_FIRE_ENABLED,
     PARTICLE_COUNT,
-    PARTICLE_SPEED,
-    GAME_OPTIONS,
-    AUDIO_DIR
+    PARTICLE_SPEED
 )
 
 class PlayingState(GameState):
     """State for main gameplay."""
     
-    def __init__(self):
-        """Initialize playing state."""
+    # The simulation clock only runs while the game itself is ticking
+    advances_clock = True
+    
+    # Every explosion this state can spawn, baked into flipbooks up front
+    FLIPBOOKS = [
+        ('explosion', PARTICLE_COUNT, PARTICLE_SPEED),
+        ('explosion', PARTICLE_COUNT * 2, PARTICLE_SPEED),
+        ('hit', PARTICLE_COUNT // 2, PARTICLE_SPEED)
+    ]
+    
+    @classmethod
+    def preload(cls, preloader: AssetPreloader) -> None:
+        """Queue sprites, the HUD font and the explosion flipbooks.
+        
+        Args:
+            preloader: Preloader to queue the assets on
+        """
+        preloader.image(GRAPHICS_DIR / "player.png", PLAYER_SIZE)
+        for color in ALIEN_COLORS:
+            preloader.image(GRAPHICS_DIR / f"{color}.png", ALIEN_SIZE)
+        preloader.image(GRAPHICS_DIR / "extra.png")
+        preloader.font("Pixeled.ttf", SCORE_FONT_SIZE)
+        preloader.defer(lambda: GlyphAtlas.shared("Pixeled.ttf", SCORE_FONT_SIZE))
+        # Baking is main-thread work; one effect per task keeps frames short
+        for spec in cls.FLIPBOOKS:
+            preloader.defer(lambda spec=spec: FlipbookCache().prebuild([spec]))
+        
+    def __init__(self, seed: Optional[int] = None, clock: Optional[SimulationClock] = None):
+        """Initialize playing state.
+        
+        Args:
+            seed: Seed for the first game, None for a random one
+            clock: Simulation clock advanced by the state manager; the only
+                time source for gameplay timers. None to create one.
+        """
         super().__init__()
-        self.last_spawn_time = 0
-        self.particles = ParticleSystem()
-        self.reset_game()
+        self.clock = clock if clock is not None else SimulationClock()
+        self.sound_manager = SoundManager()
+        self.scheduler = TimerScheduler(self.clock)
+        self.recorder: Optional[ReplayRecorder] = None
+        
+        # Bake flipbooks for every explosion this state can spawn
+        FlipbookCache().prebuild(self.FLIPBOOKS)
+        self.reset_game(seed)
+        
+    def reset_game(self, seed: Optional[int] = None) -> None:
+        """Reset game state.
+        
+        Args:
+            seed: Seed for the global RNG, None for a random one. The same
+                seed and inputs always play out the same game. Reduced to
+                32 bits, the size replay files store.
+        """
+        self.seed = (seed if seed is not None else random.getrandbits(32)) & 0xFFFFFFFF
+        random.seed(self.seed)
+        self.clock.reset()
+        self.scheduler.clear()
+        # Lasers of the previous game go back to the pool
+        LaserPool().reclaim()
         
-    def reset_game(self) -> None:
-        """Reset game state."""
         # Initialize sprite groups
         self.player = pygame.sprite.GroupSingle()
-        self.player.add(Player())
+        self.player.add(Player(clock=self.clock))
         
         # Alien setup
-        self.aliens = pygame.sprite.Group()
         self.alien_lasers = pygame.sprite.Group()
+        self.aliens = AlienHorde(
+            clock=self.clock,
+            scheduler=self.scheduler,
+            lasers=self.alien_lasers if ALIEN_FIRE_ENABLED else None
+        )
         self.spawn_aliens()  # Initial spawn
+        self.scheduler.schedule(ALIEN_SPAWN_DELAY, self.spawn_wave)
         
         # Extra setup
         self.extra = pygame.sprite.GroupSingle()
-        self.last_extra_spawn = pygame.time.get_ticks()
-        self.extra_spawn_time = randint(EXTRA_SPAWN_TIME_MIN, EXTRA_SPAWN_TIME_MAX)
+        self.scheduler.schedule(randint(EXTRA_SPAWN_TIME_MIN, EXTRA_SPAWN_TIME_MAX), self.spawn_extra)
         
         # Score and lives setup
         self.score = 0
         self.lives = PLAYER_LIVES
         
-        # Timing setup
-        self.last_spawn_time = pygame.time.get_ticks()
-        
-        # Effects setup
-        self.particles = ParticleSystem()
-        self.starfield = StarField()
+        # Effects setup; seeded from the game seed, apart from the global RNG
+        self.effects = EffectManager(self.seed)
+        self.starfield = StarField(seed=self.seed)
         
         # UI setup
         self.score_display = ScoreDisplay()
         self.lives_display = LivesDisplay()
         
-        # Music setup
-        if GAME_OPTIONS.music_enabled:
-            pygame.mixer.music.load(str(AUDIO_DIR / "music.wav"))
-            pygame.mixer.music.play(-1)
+        # Restart the music; the track stays open across games
+        MusicPlayer().play()
             
     def spawn_aliens(self) -> None:
         """Spawn new aliens."""
-        colors = ['red', 'green', 'yellow']
         count = randint(ALIEN_MIN_SPAWN_COUNT, ALIEN_MAX_SPAWN_COUNT)
         
         for _ in range(count):
-            color = choice(colors)
+            color = choice(ALIEN_COLORS)
             x = randint(50, SCREEN_WIDTH - 50)
             y = randint(-100, 0)  # Start above screen
-            self.aliens.add(Alien(x, y, color))
+            self.aliens.spawn(x, y, color)
             
-    def check_alien_spawning(self) -> None:
-        """Check if it's time to spawn new aliens."""
-        now = pygame.time.get_ticks()
-        if now - self.last_spawn_time >= ALIEN_SPAWN_DELAY:
-            self.last_spawn_time = now
-            self.spawn_aliens()
+    def spawn_wave(self) -> None:
+        """Spawn new aliens and schedule the next wave."""
+        self.spawn_aliens()
+        self.scheduler.schedule(ALIEN_SPAWN_DELAY, self.spawn_wave)
             
     def handle_collisions(self) -> None:
         """Handle all game collisions."""
@@ -101,55 +164,116 @@ class PlayingState(GameState):
                 laser.kill()
                 self.lives -= 1
                 # Create explosion particles
-                self.particles.create_explosion(
+                self.effects.create_explosion(
                     self.player.sprite.rect.center,
                     'explosion',
                     PARTICLE_COUNT,
                     PARTICLE_SPEED
                 )
+                self.sound_manager.play_explosion()
                 if self.lives <= 0:
                     self.player.sprite.kill()
+                    # Nothing left to collide with the player or its lasers
+                    return
                 
-        # Player lasers hitting aliens
-        for laser in self.player.sprite.lasers:
-            aliens_hit = pygame.sprite.spritecollide(laser, self.aliens, True)
-            if aliens_hit:
-                for alien in aliens_hit:
+        # Player lasers hitting aliens: one grid query for every laser, then
+        # the lasers are resolved in order so each alien dies to the first
+        hit_centers = []
+        lasers = self.player.sprite.lasers.sprites()
+        for laser_id, candidates in self.aliens.collide_rects([laser.rect for laser in lasers]):
+            aliens_hit = candidates[self.aliens.alive[candidates]]
+            if aliens_hit.size:
+                laser = lasers[laser_id]
+                laser.kill()
+                self.score += self.aliens.kill(aliens_hit)
+                hit_centers.extend(self.aliens.centers(aliens_hit))
+                # One request per kill; flush() merges a wave into one voice
+                for _ in range(aliens_hit.size):
+                    self.sound_manager.play_explosion()
+        if hit_centers:
+            # Create hit particles for every alien killed this tick in one batch
+            self.effects.create_explosions(
+                hit_centers,
+                'hit',
+                PARTICLE_COUNT // 2,  # Smaller explosion for hits
+                PARTICLE_SPEED
+            )
+            
+        # Player lasers hitting the UFO
+        extra = self.extra.sprite
+        if extra:
+            for laser in self.player.sprite.lasers:
+                if laser.rect.colliderect(extra.rect):
                     laser.kill()
-                    self.score += alien.value
-                    # Create hit particles
-                    self.particles.create_explosion(
-                        alien.rect.center,
-                        'hit',
-                        PARTICLE_COUNT // 2,  # Smaller explosion for hits
+                    extra.kill()
+                    self.score += extra.value
+                    self.effects.create_explosion(
+                        extra.rect.center,
+                        'explosion',
+                        PARTICLE_COUNT,
                         PARTICLE_SPEED
                     )
+                    self.sound_manager.play_explosion()
+                    break
                     
         # Direct collisions between player and aliens
-        if pygame.sprite.spritecollide(self.player.sprite, self.aliens, True):
+        aliens_hit = self.aliens.collide_rect(self.player.sprite.rect)
+        if aliens_hit.size:
+            self.aliens.kill(aliens_hit)
             self.lives -= 1
             # Create large explosion
-            self.particles.create_explosion(
+            self.effects.create_explosion(
                 self.player.sprite.rect.center,
                 'explosion',
                 PARTICLE_COUNT * 2,  # Bigger explosion for direct hits
                 PARTICLE_SPEED
             )
+            self.sound_manager.play_explosion()
             if self.lives <= 0:
                 self.player.sprite.kill()
+        self.aliens.compact()
                 
     def spawn_extra(self) -> None:
-        """Spawn extra UFO if time has passed."""
-        now = pygame.time.get_ticks()
-        if now - self.last_extra_spawn >= self.extra_spawn_time:
-            # Randomly choose which side the extra alien appears from
-            side = choice(['left', 'right'])
-            self.extra.add(Extra(side))
-            self.last_extra_spawn = now
-            self.extra_spawn_time = randint(EXTRA_SPAWN_TIME_MIN, EXTRA_SPAWN_TIME_MAX)
+        """Spawn the extra UFO and schedule the next one."""
+        # Randomly choose which side the extra alien appears from
+        side = choice(['left', 'right'])
+        self.extra.add(Extra(side))
+        self.scheduler.schedule(randint(EXTRA_SPAWN_TIME_MIN, EXTRA_SPAWN_TIME_MAX), self.spawn_extra)
+            
+    def start_recording(self, path: str) -> None:
+        """Record the current game to a replay file from the next tick on.
+        
+        Args:
+            path: Replay file path
+        """
+        self.stop_recording()
+        self.recorder = ReplayRecorder(path, self.seed)
+        
+    def stop_recording(self) -> None:
+        """Finish the replay file being recorded, if any."""
+        if self.recorder:
+            self.recorder.close(self)
+            self.recorder = None
             
     def update(self, dt: float) -> Optional[GameStateType]:
-        """Update game state.
+        """Update game state and record the tick if recording.
+        
+        Args:
+            dt: Time delta in seconds
+            
+        Returns:
+            New game state if needed
+        """
+        new_state = self.simulate(dt)
+        if self.recorder:
+            self.recorder.record(INPUT.mask, self)
+            # A replay covers a single game
+            if new_state == GameStateType.GAME_OVER:
+                self.stop_recording()
+        return new_state
+        
+    def simulate(self, dt: float) -> Optional[GameStateType]:
+        """Advance the game by one tick using the current tick's input.
         
         Args:
             dt: Time delta in seconds
@@ -158,28 +282,34 @@ class PlayingState(GameState):
             New game state if needed
         """
         # Check for pause
-        keys = pygame.key.get_pressed()
+        keys = INPUT.get_pressed()
         if keys[pygame.K_ESCAPE]:
+            MusicPlayer().pause()
             return GameStateType.PAUSED
             
+        t = PROFILER.start()
+        
         # Update all game objects
         if self.player.sprite:
-            self.player.sprite.update()
+            self.player.sprite.update(dt)
+        t = PROFILER.record('sim.player', t)
             
-        self.aliens.update()
-        self.extra.update()
-        self.alien_lasers.update()
-        self.particles.update(dt)
+        self.aliens.update(dt)
+        self.extra.update(dt)
+        self.alien_lasers.update(dt)
+        t = PROFILER.record('sim.aliens', t)
+        self.effects.update(dt)
+        t = PROFILER.record('sim.effects', t)
         self.starfield.update(dt)
+        t = PROFILER.record('sim.starfield', t)
         
-        # Spawn new aliens
-        self.check_alien_spawning()
+        # Run due timers: alien waves, the extra UFO and alien fire
+        self.scheduler.run_due()
+        t = PROFILER.record('sim.timers', t)
         
         # Check collisions
         self.handle_collisions()
-        
-        # Spawn extra
-        self.spawn_extra()
+        PROFILER.record('sim.collisions', t)
         
         # Check game over
         if self.lives <= 0:
@@ -193,23 +323,33 @@ class PlayingState(GameState):
         Args:
             screen: Surface to draw on
         """
+        t = PROFILER.start()
         # Draw background
         screen.fill((0, 0, 0))
         
         # Draw starfield
         self.starfield.draw(screen)
+        t = PROFILER.record('draw.starfield', t)
         
-        # Draw game objects
-        self.player.draw(screen)
-        self.aliens.draw(screen)
-        self.extra.draw(screen)
-        self.alien_lasers.draw(screen)
+        # Draw game objects between their last two simulated positions
+        alpha = self.interpolation
+        draw_interpolated(screen, self.player, alpha)
+        self.aliens.draw(screen, alpha)
+        draw_interpolated(screen, self.extra, alpha)
+        draw_interpolated(screen, self.alien_lasers, alpha)
         if self.player.sprite:
-            self.player.sprite.lasers.draw(screen)
+            draw_interpolated(screen, self.player.sprite.lasers, alpha)
+        t = PROFILER.record('draw.sprites', t)
             
-        # Draw particles
-        self.particles.draw(screen)
+        # Draw explosion effects
+        self.effects.draw(screen)
+        PROFILER.gauge('particles', self.effects.particles.count)
+        if PROFILER.enabled:
+            PROFILER.gauge('audio_kb', self.sound_manager.memory_bytes() / 1024.0)
+        t = PROFILER.record('draw.effects', t)
         
         # Draw UI
         self.score_display.draw(screen, self.score)
         self.lives_display.draw(screen, self.lives)
+        HUD_STATS.end_frame()
+        PROFILER.record('draw.hud', t)
@@ -4,7 +4,8 @@ import pygame
 from typing import Optional
 
 from core.states.game_state import GameState, GameStateType
-from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FONT_DIR
+from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from core.ui.font_registry import get_font
 
 class VictoryState(GameState):
     """Victory state."""
@@ -15,7 +16,7 @@ class VictoryState(GameState):
         Args:
             final_score: Final score achieved
         """
-        self.font = pygame.font.Font(str(FONT_DIR / 'Pixeled.ttf'), 20)
+        self.font = get_font('Pixeled.ttf', 20)
         self.text = self.font.render('VICTORY!', False, 'white')
         self.text_rect = self.text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/3))
         
@@ -0,0 +1,53 @@
+"""Shared font registry."""
+
+import io
+import pygame
+from typing import Dict, Optional, Tuple
+
+from config.settings import FONT_DIR
+
+_fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+# Font files read ahead of time by the asset preloader
+_font_data: Dict[str, bytes] = {}
+
+def get_font(name: Optional[str], size: int) -> pygame.font.Font:
+    """Get a font, loading each (name, size) pair only once.
+
+    Args:
+        name: Font file name in FONT_DIR, or None for pygame's default font
+        size: Font size
+
+    Returns:
+        Shared font instance
+    """
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        if name in _font_data:
+            # Each font keeps reading from its own file object
+            source = io.BytesIO(_font_data[name])
+        else:
+            source = str(FONT_DIR / name) if name else None
+        font = _fonts[key] = pygame.font.Font(source, size)
+    return font
+
+def has_font(name: Optional[str], size: int) -> bool:
+    """Check whether a font is already loaded.
+
+    Args:
+        name: Font file name in FONT_DIR, or None for pygame's default font
+        size: Font size
+
+    Returns:
+        True if get_font() would not touch the disk
+    """
+    return (name, size) in _fonts
+
+def add_font_data(name: str, data: bytes) -> None:
+    """Provide the contents of a font file so fonts are opened from memory.
+
+    Args:
+        name: Font file name in FONT_DIR
+        data: File contents
+    """
+    _font_data[name] = data
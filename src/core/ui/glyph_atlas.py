@@ -0,0 +1,132 @@
+"""Glyph atlas and cached HUD text rendering."""
+
+import pygame
+from typing import Dict, Tuple
+
+from config.settings import HUD_CHARSET
+from core.ui.font_registry import get_font
+from core.utils.profiler import PROFILER
+
+class HudStats:
+    """Per-frame counters for HUD text composition."""
+
+    def __init__(self):
+        """Initialize counters."""
+        self.renders = 0
+        self.hits = 0
+        self.last_renders = 0
+        self.last_hits = 0
+
+    def end_frame(self) -> None:
+        """Report this frame's counts to the profiler and start counting a new frame."""
+        self.last_renders = self.renders
+        self.last_hits = self.hits
+        PROFILER.gauge('hud_renders', self.renders)
+        PROFILER.gauge('hud_hits', self.hits)
+        self.renders = 0
+        self.hits = 0
+
+# Global HUD statistics instance
+HUD_STATS = HudStats()
+
+class GlyphAtlas:
+    """Pre-rendered glyphs for one font, size and color."""
+
+    _atlases: Dict[Tuple[str, int, str], "GlyphAtlas"] = {}
+
+    def __init__(self, font: pygame.font.Font, color: str = 'white', charset: str = HUD_CHARSET):
+        """Render every glyph in the charset.
+
+        Args:
+            font: Font to render glyphs with
+            color: Text color
+            charset: Characters to pre-render
+        """
+        self.font = font
+        self.color = color
+        self.height = font.get_height()
+        self.glyphs: Dict[str, pygame.Surface] = {}
+        for char in charset:
+            self.glyph(char)
+
+    @classmethod
+    def shared(cls, font_name: str, size: int, color: str = 'white') -> "GlyphAtlas":
+        """Get a shared atlas for a font from the font registry.
+
+        Args:
+            font_name: Font file name in FONT_DIR
+            size: Font size
+            color: Text color
+
+        Returns:
+            Shared glyph atlas
+        """
+        key = (font_name, size, color)
+        atlas = cls._atlases.get(key)
+        if atlas is None:
+            atlas = cls._atlases[key] = cls(get_font(font_name, size), color)
+        return atlas
+
+    def glyph(self, char: str) -> pygame.Surface:
+        """Get the surface for a character, rendering it if not in the atlas.
+
+        Args:
+            char: Single character
+
+        Returns:
+            Glyph surface
+        """
+        surface = self.glyphs.get(char)
+        if surface is None:
+            surface = self.glyphs[char] = self.font.render(char, False, self.color)
+        return surface
+
+    def compose(self, text: str) -> pygame.Surface:
+        """Build a text surface from cached glyphs.
+
+        Args:
+            text: Text to compose
+
+        Returns:
+            Surface containing the text
+        """
+        glyphs = [self.glyph(char) for char in text]
+        width = sum(glyph.get_width() for glyph in glyphs)
+        surface = pygame.Surface((max(1, width), self.height), pygame.SRCALPHA)
+        x = 0
+        for glyph in glyphs:
+            surface.blit(glyph, (x, 0))
+            x += glyph.get_width()
+        return surface
+
+class HudText:
+    """HUD label that re-composes its surface only when its value changes."""
+
+    def __init__(self, atlas: GlyphAtlas, template: str):
+        """Initialize the label.
+
+        Args:
+            atlas: Glyph atlas to compose text from
+            template: Format string with one '{}' for the value
+        """
+        self.atlas = atlas
+        self.template = template
+        self._value = None
+        self.surface = None
+
+    def get_surface(self, value) -> pygame.Surface:
+        """Get the label surface for a value.
+
+        Args:
+            value: Value to display
+
+        Returns:
+            Cached or newly composed surface
+        """
+        if self.surface is None or value != self._value:
+            self._value = value
+            self.surface = self.atlas.compose(self.template.format(value))
+            HUD_STATS.renders += 1
+        else:
+            HUD_STATS.hits += 1
+        return self.surface
@@ -1,14 +1,16 @@
 """Lives display UI component."""
 
 import pygame
-from config.settings import FONT_DIR, SCREEN_WIDTH, SCORE_FONT_SIZE
+from config.settings import SCREEN_WIDTH, SCORE_FONT_SIZE
+from core.ui.glyph_atlas import GlyphAtlas, HudText
 
 class LivesDisplay:
     """Display for the player's remaining lives."""
     
     def __init__(self):
         """Initialize the lives display."""
-        self.font = pygame.font.Font(str(FONT_DIR / "Pixeled.ttf"), SCORE_FONT_SIZE)
+        atlas = GlyphAtlas.shared("Pixeled.ttf", SCORE_FONT_SIZE)
+        self.text = HudText(atlas, 'Lives: {}')
         
     def draw(self, screen: pygame.Surface, lives: int) -> None:
         """Draw the lives count on screen.
@@ -17,6 +19,6 @@ class LivesDisplay:
             screen: Surface to draw on
             lives: Number of lives to display
         """
-        lives_surf = self.font.render(f'Lives: {lives}', False, 'white')
+        lives_surf = self.text.get_surface(lives)
         lives_rect = lives_surf.get_rect(topright=(SCREEN_WIDTH - 20, 20))
         screen.blit(lives_surf, lives_rect)
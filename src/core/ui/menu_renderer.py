@@ -0,0 +1,122 @@
+"""Cached rendering for menu screens."""
+
+import pygame
+from typing import List, Optional, Sequence, Tuple
+
+from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, MENU_FONT_SIZE
+from core.ui.font_registry import get_font
+
+CREDITS_TEXT = "Game by Josue Barros - 2025"
+MENU_FONT_NAME = "Pixeled.ttf"
+
+class MenuRenderer:
+    """Renders a title, option list and credits line into one cached surface.
+
+    The surface is rebuilt only when the option texts or the selected
+    option change, so an idle menu costs a single blit per frame.
+    """
+
+    def __init__(
+        self,
+        title: str,
+        title_size: int = MENU_FONT_SIZE,
+        background: Optional[Tuple[int, int, int, int]] = (0, 0, 0, 255)
+    ):
+        """Initialize the renderer.
+
+        Args:
+            title: Title text
+            title_size: Font size of the title
+            background: RGBA fill behind the menu, None for transparent
+        """
+        self.font = get_font(MENU_FONT_NAME, MENU_FONT_SIZE)
+        self.title_surf = get_font(MENU_FONT_NAME, title_size).render(title, False, 'white')
+        self.title_rect = self.title_surf.get_rect(
+            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4)
+        )
+        self.credits_surf = get_font(MENU_FONT_NAME, MENU_FONT_SIZE // 2).render(
+            CREDITS_TEXT, False, 'white'
+        )
+        self.credits_rect = self.credits_surf.get_rect(
+            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30)
+        )
+        self.background = background
+        self._key = None
+        self._surface: Optional[pygame.Surface] = None
+        self._option_rects: List[pygame.Rect] = []
+        # Regions changed by the most recent get_surface call
+        self.dirty_rects: Optional[List[pygame.Rect]] = None
+
+    def option_rect(self, surface: pygame.Surface, index: int) -> pygame.Rect:
+        """Get the screen rect of an option label.
+
+        Args:
+            surface: Rendered option label
+            index: Position of the option in the list
+
+        Returns:
+            Rect centered on the option's row
+        """
+        return surface.get_rect(
+            center=(SCREEN_WIDTH // 2,
+                    SCREEN_HEIGHT // 2 + index * 50)
+        )
+
+    def get_surface(self, options: Sequence[str], selected: int) -> pygame.Surface:
+        """Get the menu surface, re-rendering it only if its content changed.
+
+        Args:
+            options: Option label texts
+            selected: Index of the highlighted option
+
+        Returns:
+            Full-screen menu surface
+        """
+        key = (tuple(options), selected)
+        if key == self._key:
+            self.dirty_rects = []
+        else:
+            old_rects = self._option_rects
+            first_render = self._key is None
+            self._key = key
+            self._surface = self._render(options, selected)
+            self.dirty_rects = None if first_render else old_rects + self._option_rects
+        return self._surface
+
+    def _render(self, options: Sequence[str], selected: int) -> pygame.Surface:
+        """Render the whole menu.
+
+        Args:
+            options: Option label texts
+            selected: Index of the highlighted option
+
+        Returns:
+            Full-screen menu surface
+        """
+        if self.background and self.background[3] == 255:
+            surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            surface.fill(self.background[:3])
+        else:
+            surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            if self.background:
+                surface.fill(self.background)
+        surface.blit(self.title_surf, self.title_rect)
+        self._option_rects = []
+        for i, text in enumerate(options):
+            color = 'yellow' if i == selected else 'white'
+            text_surf = self.font.render(text, False, color)
+            rect = self.option_rect(text_surf, i)
+            surface.blit(text_surf, rect)
+            self._option_rects.append(rect)
+        surface.blit(self.credits_surf, self.credits_rect)
+        return surface
+
+    def draw(self, screen: pygame.Surface, options: Sequence[str], selected: int) -> None:
+        """Draw the menu.
+
+        Args:
+            screen: Surface to draw on
+            options: Option label texts
+            selected: Index of the highlighted option
+        """
+        screen.blit(self.get_surface(options, selected), (0, 0))
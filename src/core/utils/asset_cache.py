@@ -0,0 +1,179 @@
+"""Shared cache for decoded, scaled and display-converted image surfaces."""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+import pygame
+
+from config.settings import ASSET_CACHE_BUDGET
+
+CacheKey = Tuple[str, Optional[Tuple[int, int]], str]
+
+class AssetCache:
+    """Process-wide image cache with optional LRU memory budget.
+
+    Surfaces handed out by the cache are shared between every caller that
+    asks for the same (path, size, mode) key, so they must be treated as
+    read-only. Copy a surface before drawing into it.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        """Initialize empty cache and counters."""
+        self._surfaces: "OrderedDict[CacheKey, pygame.Surface]" = OrderedDict()
+        self._sizes: Dict[CacheKey, int] = {}
+        self.budget_bytes: Optional[int] = ASSET_CACHE_BUDGET
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def load_image(
+        self,
+        path: Union[str, Path],
+        size: Optional[Tuple[int, int]] = None,
+        alpha: bool = True
+    ) -> pygame.Surface:
+        """Get an image surface, loading and scaling it on first use.
+
+        Args:
+            path: Path to the image file
+            size: Target (width, height), or None to keep the original size
+            alpha: Convert with per-pixel alpha if True, else to opaque display format
+
+        Returns:
+            Shared display-format surface
+        """
+        key = (str(path), tuple(size) if size else None, 'alpha' if alpha else 'opaque')
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        return self.add_decoded(path, size, alpha, pygame.image.load(key[0]))
+
+    def add_decoded(
+        self,
+        path: Union[str, Path],
+        size: Optional[Tuple[int, int]],
+        alpha: bool,
+        surface: pygame.Surface
+    ) -> pygame.Surface:
+        """Finish a freshly decoded image and cache it.
+
+        Display-format conversion needs the display, so images decoded on
+        another thread are passed in here on the main thread.
+
+        Args:
+            path: Path the image was loaded from
+            size: Target (width, height), or None to keep the original size
+            alpha: Convert with per-pixel alpha if True, else to opaque display format
+            surface: Surface returned by pygame.image.load
+
+        Returns:
+            Shared display-format surface
+        """
+        key = (str(path), tuple(size) if size else None, 'alpha' if alpha else 'opaque')
+        self.misses += 1
+        surface = surface.convert_alpha() if alpha else surface.convert()
+        if key[1] and surface.get_size() != key[1]:
+            surface = pygame.transform.scale(surface, key[1])
+        self._store(key, surface)
+        return surface
+
+    def contains(
+        self,
+        path: Union[str, Path],
+        size: Optional[Tuple[int, int]] = None,
+        alpha: bool = True
+    ) -> bool:
+        """Check whether an image is cached without touching its LRU position.
+
+        Args:
+            path: Path to the image file
+            size: Target (width, height), or None to keep the original size
+            alpha: Per-pixel alpha or opaque variant
+
+        Returns:
+            True if the image is cached
+        """
+        return (str(path), tuple(size) if size else None, 'alpha' if alpha else 'opaque') in self._surfaces
+
+    def _store(self, key: CacheKey, surface: pygame.Surface) -> None:
+        """Insert a surface and evict least recently used entries over budget.
+
+        Args:
+            key: Cache key for the surface
+            surface: Surface to store
+        """
+        nbytes = surface.get_pitch() * surface.get_height()
+        self._surfaces[key] = surface
+        self._sizes[key] = nbytes
+        self.used_bytes += nbytes
+
+        if self.budget_bytes is None:
+            return
+        # Never evict the entry we just inserted, even if it alone exceeds the budget
+        while self.used_bytes > self.budget_bytes and len(self._surfaces) > 1:
+            old_key, _ = self._surfaces.popitem(last=False)
+            self.used_bytes -= self._sizes.pop(old_key)
+            self.evictions += 1
+
+    def set_budget(self, budget_bytes: Optional[int]) -> None:
+        """Change the memory budget, evicting entries if needed.
+
+        Args:
+            budget_bytes: New budget in bytes, or None for unlimited
+        """
+        self.budget_bytes = budget_bytes
+        if budget_bytes is None:
+            return
+        while self.used_bytes > budget_bytes and self._surfaces:
+            old_key, _ = self._surfaces.popitem(last=False)
+            self.used_bytes -= self._sizes.pop(old_key)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached surfaces and reset counters, keeping the budget."""
+        budget = self.budget_bytes
+        self._initialize()
+        self.budget_bytes = budget
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache counters.
+
+        Returns:
+            Dictionary with entry count, memory use and hit/miss/eviction counts
+        """
+        return {
+            'entries': len(self._surfaces),
+            'used_bytes': self.used_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+def load_image(
+    path: Union[str, Path],
+    size: Optional[Tuple[int, int]] = None,
+    alpha: bool = True
+) -> pygame.Surface:
+    """Load an image through the shared asset cache.
+
+    Args:
+        path: Path to the image file
+        size: Target (width, height), or None to keep the original size
+        alpha: Convert with per-pixel alpha if True, else to opaque display format
+
+    Returns:
+        Shared display-format surface
+    """
+    return AssetCache().load_image(path, size, alpha)
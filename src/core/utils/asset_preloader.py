@@ -0,0 +1,179 @@
+"""Background asset loading on a thread pool."""
+
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Deque, Optional, Tuple, Union
+import pygame
+
+from config.settings import FONT_DIR, ASSET_LOADER_THREADS
+from core.utils.asset_cache import AssetCache
+from core.utils.sound_manager import add_decoded_sound
+from core.ui.font_registry import add_font_data, get_font, has_font
+
+def _read_bytes(path: Path) -> bytes:
+    """Read a whole file on a worker thread."""
+    with open(path, 'rb') as f:
+        return f.read()
+
+class AssetPreloader:
+    """Decodes images, sounds and fonts on worker threads.
+
+    Work is split in two halves. The decode half (reading the file,
+    decompressing PNGs, decoding WAVs) runs on a thread pool. The finish
+    half needs the main thread, e.g. converting to the display format, and
+    runs from poll(), which the game loop calls every frame with a time
+    budget so animation keeps going while assets load. Main-thread-only
+    work such as baking effects can be queued with defer().
+
+    Jobs are finished strictly in the order they were queued, so a job
+    can rely on everything queued before it being finished.
+    """
+
+    def __init__(self, workers: int = ASSET_LOADER_THREADS):
+        """Initialize an idle preloader.
+
+        Args:
+            workers: Number of decoding threads
+        """
+        self.workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._jobs: Deque[Tuple[Optional[Future], Callable[..., Any]]] = deque()
+        self.queued = 0
+        self.finished = 0
+        self.failed = 0
+
+    @property
+    def done(self) -> bool:
+        """Check whether every queued job has been finished."""
+        return not self._jobs
+
+    def submit(self, decode: Callable[[], Any], finish: Callable[[Any], Any]) -> None:
+        """Queue a job with a threaded and a main-thread half.
+
+        Args:
+            decode: Runs on a worker thread; must not touch the display
+            finish: Runs on the main thread with decode's result
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix='asset-loader')
+        self._jobs.append((self._executor.submit(decode), finish))
+        self.queued += 1
+
+    def defer(self, task: Callable[[], Any]) -> None:
+        """Queue main-thread work to run after the jobs queued before it.
+
+        Args:
+            task: Callable run from poll() or wait()
+        """
+        self._jobs.append((None, task))
+        self.queued += 1
+
+    def image(self, path: Union[str, Path], size: Optional[Tuple[int, int]] = None, alpha: bool = True) -> None:
+        """Queue an image for the shared asset cache.
+
+        Args:
+            path: Path to the image file
+            size: Target (width, height), or None to keep the original size
+            alpha: Convert with per-pixel alpha if True, else to opaque display format
+        """
+        cache = AssetCache()
+        if cache.contains(path, size, alpha):
+            return
+
+        def finish(surface: pygame.Surface) -> None:
+            # The main thread may have loaded it in the meantime
+            if not cache.contains(path, size, alpha):
+                cache.add_decoded(path, size, alpha, surface)
+        self.submit(lambda: pygame.image.load(str(path)), finish)
+
+    def sound(self, path: Union[str, Path]) -> None:
+        """Queue a sound effect for the sound manager.
+
+        Args:
+            path: Path to the sound file
+        """
+        if pygame.mixer.get_init() is None:
+            return
+        self.submit(lambda: pygame.mixer.Sound(str(path)), lambda sound: add_decoded_sound(path, sound))
+
+    def font(self, name: Optional[str], size: int) -> None:
+        """Queue a font for the font registry.
+
+        The file is read on a worker thread. The font itself is opened
+        from memory on the main thread because SDL_ttf shares one FreeType
+        instance between all fonts.
+
+        Args:
+            name: Font file name in FONT_DIR, or None for pygame's default font
+            size: Font size
+        """
+        if has_font(name, size):
+            return
+        if name is None:
+            self.defer(lambda: get_font(None, size))
+            return
+
+        def finish(data: bytes) -> None:
+            add_font_data(name, data)
+            get_font(name, size)
+        self.submit(lambda: _read_bytes(FONT_DIR / name), finish)
+
+    def poll(self, budget: float) -> bool:
+        """Finish completed jobs on the main thread for up to a time budget.
+
+        Args:
+            budget: Seconds to spend; at least one ready job always runs
+
+        Returns:
+            True once every queued job has been finished
+        """
+        deadline = time.perf_counter() + budget
+        while self._jobs:
+            future, _ = self._jobs[0]
+            if future is not None and not future.done():
+                break
+            self._finish_next()
+            if time.perf_counter() >= deadline:
+                break
+        return self._drained()
+
+    def wait(self) -> None:
+        """Block until every queued job has been finished."""
+        while self._jobs:
+            self._finish_next()
+        self._drained()
+
+    def _finish_next(self) -> None:
+        """Run the main-thread half of the oldest job, waiting for its decode."""
+        future, finish = self._jobs.popleft()
+        self.finished += 1
+        try:
+            if future is None:
+                finish()
+            else:
+                finish(future.result())
+        except (pygame.error, OSError):
+            # Missing or broken files are loaded (and reported) again on first use
+            self.failed += 1
+
+    def _drained(self) -> bool:
+        """Release the worker threads once the queue is empty.
+
+        Returns:
+            True if the queue is empty
+        """
+        if self._jobs:
+            return False
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        return True
+
+    def shutdown(self) -> None:
+        """Drop queued jobs and stop the worker threads."""
+        self._jobs.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -11,12 +11,27 @@ class CollisionManager:
     def __init__(self):
         """Initialize collision manager."""
         self.sound_manager = SoundManager()
+        
+    def _hit_shields(self, laser: pygame.sprite.Sprite, shields: pygame.sprite.Group) -> bool:
+        """Stamp laser damage into the first shield it touches.
+        
+        Args:
+            laser: Laser sprite
+            shields: Group of shield sprites
+            
+        Returns:
+            True if the laser hit a shield
+        """
+        for shield in pygame.sprite.spritecollide(laser, shields, False):
+            if shield.hit(laser.rect, upward=laser.speed < 0):
+                return True
+        return False
     
     def check_player_laser_collisions(
         self,
         player_lasers: pygame.sprite.Group,
         aliens: pygame.sprite.Group,
-        blocks: pygame.sprite.Group,
+        shields: pygame.sprite.Group,
         extra: pygame.sprite.GroupSingle
     ) -> int:
         """Check collisions between player lasers and other entities.
@@ -24,7 +39,7 @@ class CollisionManager:
         Args:
             player_lasers: Group of player laser sprites
             aliens: Group of alien sprites
-            blocks: Group of obstacle block sprites
+            shields: Group of shield sprites
             extra: Group containing bonus UFO
             
         Returns:
@@ -34,8 +49,8 @@ class CollisionManager:
         
         if player_lasers:
             for laser in player_lasers:
-                # Check collision with blocks
-                if pygame.sprite.spritecollide(laser, blocks, True):
+                # Check collision with shields
+                if self._hit_shields(laser, shields):
                     laser.kill()
                 
                 # Check collision with aliens
@@ -57,22 +72,22 @@ class CollisionManager:
         self,
         alien_lasers: pygame.sprite.Group,
         player: pygame.sprite.GroupSingle,
-        blocks: pygame.sprite.Group
+        shields: pygame.sprite.Group
     ) -> bool:
         """Check collisions between alien lasers and other entities.
         
         Args:
             alien_lasers: Group of alien laser sprites
             player: Group containing player sprite
-            blocks: Group of obstacle block sprites
+            shields: Group of shield sprites
             
         Returns:
             True if player was hit, False otherwise
         """
         if alien_lasers:
             for laser in alien_lasers:
-                # Check collision with blocks
-                if pygame.sprite.spritecollide(laser, blocks, True):
+                # Check collision with shields
+                if self._hit_shields(laser, shields):
                     laser.kill()
                 
                 # Check collision with player
@@ -85,22 +100,23 @@ class CollisionManager:
         self,
         aliens: pygame.sprite.Group,
         player: pygame.sprite.GroupSingle,
-        blocks: pygame.sprite.Group
+        shields: pygame.sprite.Group
     ) -> bool:
-        """Check if aliens have reached the bottom or collided with player/blocks.
+        """Check if aliens have reached the bottom or collided with player/shields.
         
         Args:
             aliens: Group of alien sprites
             player: Group containing player sprite
-            blocks: Group of obstacle block sprites
+            shields: Group of shield sprites
             
         Returns:
             True if game should end, False otherwise
         """
         if aliens:
             for alien in aliens:
-                # Check collision with blocks
-                pygame.sprite.spritecollide(alien, blocks, True)
+                # Aliens carve through shields they touch
+                for shield in pygame.sprite.spritecollide(alien, shields, False):
+                    shield.erase(alien.rect)
                 
                 # Check collision with player
                 if pygame.sprite.spritecollide(alien, player, False):
@@ -0,0 +1,56 @@
+"""Dirty-rectangle display presentation."""
+
+from typing import List, Optional
+import pygame
+
+from config.settings import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    DIRTY_RECT_RENDERING,
+    DIRTY_RECT_MAX_COVERAGE
+)
+
+class DirtyRectPresenter:
+    """Pushes only changed screen regions to the display when possible.
+
+    States report the regions their last draw changed. If a state cannot
+    tell (None), the presenter was invalidated, or the reported regions
+    cover too much of the screen, it falls back to a full flip.
+    """
+
+    def __init__(self, enabled: bool = DIRTY_RECT_RENDERING, max_coverage: float = DIRTY_RECT_MAX_COVERAGE):
+        """Initialize the presenter.
+
+        Args:
+            enabled: Whether dirty-rect presentation is used at all
+            max_coverage: Fraction of the screen above which a full flip is cheaper
+        """
+        self.enabled = enabled
+        self.max_area = int(SCREEN_WIDTH * SCREEN_HEIGHT * max_coverage)
+        self._force_full = True
+        self.full_flips = 0
+        self.partial_updates = 0
+        self.skipped = 0
+
+    def invalidate(self) -> None:
+        """Force the next frame to be presented with a full flip."""
+        self._force_full = True
+
+    def present(self, rects: Optional[List[pygame.Rect]]) -> None:
+        """Present the frame.
+
+        Args:
+            rects: Regions changed since the last frame, or None if unknown
+        """
+        if self.enabled and not self._force_full and rects is not None:
+            if not rects:
+                self.skipped += 1
+                return
+            # Overlaps are counted twice, which only makes the fallback more eager
+            if sum(rect.width * rect.height for rect in rects) <= self.max_area:
+                pygame.display.update(rects)
+                self.partial_updates += 1
+                return
+        self._force_full = False
+        pygame.display.flip()
+        self.full_flips += 1
@@ -0,0 +1,78 @@
+"""Per-tick keyboard state that can be sampled live or fed from a replay."""
+
+from typing import Optional
+import pygame
+
+# Keys gameplay reads, in bit order of the input mask
+TRACKED_KEYS = (
+    pygame.K_LEFT,
+    pygame.K_RIGHT,
+    pygame.K_a,
+    pygame.K_d,
+    pygame.K_SPACE,
+    pygame.K_UP,
+    pygame.K_w,
+    pygame.K_ESCAPE
+)
+_KEY_BITS = {key: 1 << bit for bit, key in enumerate(TRACKED_KEYS)}
+
+class KeyState:
+    """Read-only view of an input mask, indexable like pygame.key.get_pressed()."""
+
+    def __init__(self, mask: int = 0):
+        """Initialize key state.
+
+        Args:
+            mask: Bit mask of pressed TRACKED_KEYS
+        """
+        self.mask = mask
+
+    def __getitem__(self, key: int) -> bool:
+        """Check whether a key is pressed; untracked keys are never pressed."""
+        return bool(self.mask & _KEY_BITS.get(key, 0))
+
+class InputState:
+    """Keyboard state for the current simulation tick."""
+
+    def __init__(self):
+        """Initialize with no keys pressed."""
+        self.keys = KeyState()
+        self._fed_mask: Optional[int] = None
+
+    @property
+    def mask(self) -> int:
+        """Get the input mask for the current tick."""
+        return self.keys.mask
+
+    def feed(self, mask: int) -> None:
+        """Use a recorded mask for the next tick instead of the keyboard.
+
+        Args:
+            mask: Bit mask of pressed TRACKED_KEYS
+        """
+        self._fed_mask = mask
+
+    def begin_tick(self) -> KeyState:
+        """Sample input for a new tick.
+
+        Returns:
+            Key state for the tick
+        """
+        if self._fed_mask is not None:
+            mask = self._fed_mask
+            self._fed_mask = None
+        else:
+            pressed = pygame.key.get_pressed()
+            mask = 0
+            for key, bit in _KEY_BITS.items():
+                if pressed[key]:
+                    mask |= bit
+        self.keys = KeyState(mask)
+        return self.keys
+
+    def get_pressed(self) -> KeyState:
+        """Get the key state sampled at the start of the current tick."""
+        return self.keys
+
+# Global input state instance
+INPUT = InputState()
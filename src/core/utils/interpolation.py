@@ -0,0 +1,23 @@
+"""Render interpolation between simulation ticks."""
+
+from typing import Iterable
+import pygame
+
+from core.utils.profiler import PROFILER
+
+def draw_interpolated(screen: pygame.Surface, sprites: Iterable[pygame.sprite.Sprite], alpha: float) -> None:
+    """Draw sprites blended between their previous and current tick positions.
+
+    Args:
+        screen: Surface to draw on
+        sprites: Sprites with ``image``, ``rect`` and ``prev_topleft``
+        alpha: Fraction of a tick elapsed since the last simulation step (0-1)
+    """
+    blits = []
+    for sprite in sprites:
+        x, y = sprite.rect.topleft
+        px, py = sprite.prev_topleft
+        blits.append((sprite.image, (round(px + (x - px) * alpha), round(py + (y - py) * alpha))))
+    screen.blits(blits, doreturn=False)
+    PROFILER.count('sprites', len(blits))
+    PROFILER.count('blits', len(blits))
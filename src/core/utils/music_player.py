@@ -0,0 +1,118 @@
+"""Streamed background music."""
+
+from typing import Dict, Optional
+import pygame
+
+from config.settings import (
+    AUDIO_DIR,
+    MUSIC_FILE,
+    MUSIC_VOLUME,
+    MIXER_BUFFER,
+    GAME_OPTIONS
+)
+
+class MusicPlayer:
+    """Singleton that streams the music track through pygame.mixer.music.
+
+    The track is opened once and decoded in small pieces as the mixer
+    plays it, so only the mixer's buffer is resident instead of the whole
+    uncompressed track. Restarting, pausing and resuming reuse the open
+    stream. A missing or unreadable track leaves the player silent.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        """Initialize an unloaded player."""
+        self.loaded = False
+        self.paused = False
+        self.loads = 0
+        # Set when opening the track failed, so it isn't retried every game
+        self.error: Optional[str] = None
+
+    @property
+    def available(self) -> bool:
+        """Check whether the mixer is up and the track can be played."""
+        if pygame.mixer.get_init() is None or self.error is not None:
+            return False
+        return self.loaded or self._load()
+
+    def _load(self) -> bool:
+        """Open the music track for streaming.
+
+        Returns:
+            True if the track was opened
+        """
+        try:
+            pygame.mixer.music.load(str(AUDIO_DIR / MUSIC_FILE))
+        except (pygame.error, FileNotFoundError) as e:
+            self.error = str(e)
+            return False
+        pygame.mixer.music.set_volume(MUSIC_VOLUME)
+        self.loaded = True
+        self.loads += 1
+        return True
+
+    def play(self) -> None:
+        """Play the track from the start, looping, if music is enabled."""
+        if not GAME_OPTIONS.music_enabled or not self.available:
+            return
+        pygame.mixer.music.play(-1)
+        self.paused = False
+
+    def pause(self) -> None:
+        """Pause the track where it is."""
+        if self.loaded and pygame.mixer.music.get_busy():
+            pygame.mixer.music.pause()
+            self.paused = True
+
+    def resume(self) -> None:
+        """Continue a paused track, or start it if music was switched on meanwhile."""
+        if not GAME_OPTIONS.music_enabled:
+            return
+        if self.paused:
+            pygame.mixer.music.unpause()
+            self.paused = False
+        elif not (self.loaded and pygame.mixer.music.get_busy()):
+            self.play()
+
+    def stop(self) -> None:
+        """Stop the track, keeping it open."""
+        if self.loaded:
+            pygame.mixer.music.stop()
+        self.paused = False
+
+    def apply_options(self) -> None:
+        """Stop the track if music was switched off in the options."""
+        if not GAME_OPTIONS.music_enabled:
+            self.stop()
+
+    def buffer_bytes(self) -> int:
+        """Get the size of the decode buffer the streamed track occupies.
+
+        Returns:
+            Bytes of one mixer buffer, 0 if nothing is loaded
+        """
+        mixer = pygame.mixer.get_init()
+        if mixer is None or not self.loaded:
+            return 0
+        _, size, channels = mixer
+        return MIXER_BUFFER * channels * (abs(size) // 8)
+
+    def stats(self) -> Dict[str, int]:
+        """Get music counters.
+
+        Returns:
+            Dictionary with the number of times the track was opened and
+            its resident buffer size
+        """
+        return {
+            'loads': self.loads,
+            'buffer_bytes': self.buffer_bytes()
+        }
@@ -0,0 +1,218 @@
+"""Frame profiler with per-phase timings, counters and an on-screen graph."""
+
+import csv
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+import pygame
+
+from config.settings import (
+    SCREEN_WIDTH,
+    PROFILER_GRAPH_FRAMES,
+    PROFILER_HISTORY_FRAMES,
+    PROFILER_CSV_PATH
+)
+
+def _noop_start() -> float:
+    """Stand-in for FrameProfiler.start while disabled."""
+    return 0.0
+
+def _noop_record(name: str, start: float) -> float:
+    """Stand-in for FrameProfiler.record while disabled."""
+    return 0.0
+
+def _noop_count(name: str, amount: int = 1) -> None:
+    """Stand-in for FrameProfiler.count and gauge while disabled."""
+
+class FrameProfiler:
+    """Collects per-frame phase timings and counters.
+
+    Instrumented code chains timings through start() and record():
+
+        t = PROFILER.start()
+        do_work()
+        t = PROFILER.record('work', t)
+
+    While the profiler is disabled those methods are rebound to no-op
+    functions, so instrumentation costs one trivial call per site and no
+    clock reads or bookkeeping.
+    """
+
+    def __init__(self):
+        """Initialize a disabled profiler."""
+        self.enabled = False
+        self.frames = 0
+        self.history: Deque[Dict[str, float]] = deque(maxlen=PROFILER_HISTORY_FRAMES)
+        self.frame_times: Deque[float] = deque(maxlen=PROFILER_GRAPH_FRAMES)
+        self._timings: Dict[str, float] = {}
+        self._counters: Dict[str, float] = {}
+        self._frame_start: Optional[float] = None
+        self._font = None
+        self._bind()
+
+    def _bind(self) -> None:
+        """Point the instrumentation methods at real or no-op implementations."""
+        if self.enabled:
+            self.start = time.perf_counter
+            self.record = self._record
+            self.count = self._count
+            self.gauge = self._gauge
+            self.begin_frame = self._begin_frame
+        else:
+            self.start = _noop_start
+            self.record = _noop_record
+            self.count = _noop_count
+            self.gauge = _noop_count
+            self.begin_frame = _noop_start
+
+    def set_enabled(self, enabled: bool) -> None:
+        """Turn the profiler on or off.
+
+        Args:
+            enabled: Whether to collect data and draw the overlay
+        """
+        self.enabled = enabled
+        self._frame_start = None
+        self._timings = {}
+        self._counters = {}
+        self._bind()
+
+    def toggle(self) -> None:
+        """Turn the profiler on if off and off if on."""
+        self.set_enabled(not self.enabled)
+
+    def _record(self, name: str, start: float) -> float:
+        """Add the time since start to a phase.
+
+        Args:
+            name: Phase name
+            start: Value returned by start() or a previous record()
+
+        Returns:
+            Current time, to chain into the next record()
+        """
+        now = time.perf_counter()
+        self._timings[name] = self._timings.get(name, 0.0) + now - start
+        return now
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        """Add to a counter for the current frame.
+
+        Args:
+            name: Counter name
+            amount: Amount to add
+        """
+        self._counters[name] = self._counters.get(name, 0) + amount
+
+    def _gauge(self, name: str, value: float) -> None:
+        """Set a value for the current frame, e.g. a live object count.
+
+        Args:
+            name: Gauge name
+            value: Current value
+        """
+        self._counters[name] = value
+
+    def _begin_frame(self) -> float:
+        """Close the previous frame's record and start a new frame.
+
+        Returns:
+            Frame start time
+        """
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            frame_ms = (now - self._frame_start) * 1000.0
+            row = {'frame': self.frames, 'frame_ms': frame_ms}
+            for name, seconds in self._timings.items():
+                row[name + '_ms'] = seconds * 1000.0
+            row.update(self._counters)
+            self.history.append(row)
+            self.frame_times.append(frame_ms)
+            self.frames += 1
+        self._frame_start = now
+        self._timings = {}
+        self._counters = {}
+        return now
+
+    def percentiles(self) -> Dict[str, float]:
+        """Get frame time percentiles over the graph window.
+
+        Returns:
+            Milliseconds at p50, p95 and p99, empty if no frames were recorded
+        """
+        if not self.frame_times:
+            return {}
+        ordered = sorted(self.frame_times)
+        last = len(ordered) - 1
+        return {
+            'p50': ordered[round(last * 0.50)],
+            'p95': ordered[round(last * 0.95)],
+            'p99': ordered[round(last * 0.99)]
+        }
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """Draw the frame-time graph, percentiles and last frame's data.
+
+        Args:
+            screen: Surface to draw on
+        """
+        if not self.enabled:
+            return
+        if self._font is None:
+            from core.ui.font_registry import get_font
+            self._font = get_font(None, 18)
+
+        width, height = PROFILER_GRAPH_FRAMES, 60
+        left, top = SCREEN_WIDTH - width - 10, 10
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 160))
+        # 1px per millisecond, with a reference line at 60 FPS
+        budget_y = height - round(1000.0 / 60.0)
+        pygame.draw.line(panel, (80, 80, 80), (0, budget_y), (width, budget_y))
+        for x, frame_ms in enumerate(self.frame_times):
+            bar = min(height, round(frame_ms))
+            color = (0, 200, 0) if frame_ms <= 1000.0 / 60.0 + 1 else (230, 60, 60)
+            pygame.draw.line(panel, color, (x, height - bar), (x, height - 1))
+        screen.blit(panel, (left, top))
+
+        lines: List[str] = []
+        stats = self.percentiles()
+        if stats:
+            lines.append("frame ms  p50 {p50:.1f}  p95 {p95:.1f}  p99 {p99:.1f}".format(**stats))
+        if self.history:
+            last = self.history[-1]
+            for name, value in last.items():
+                if name in ('frame', 'frame_ms'):
+                    continue
+                if name.endswith('_ms'):
+                    lines.append(f"{name[:-3]:<18}{value:7.2f} ms")
+                else:
+                    lines.append(f"{name:<18}{value:7.0f}")
+        y = top + height + 4
+        for line in lines:
+            surface = self._font.render(line, False, 'white', (0, 0, 0))
+            screen.blit(surface, (left, y))
+            y += surface.get_height()
+
+    def dump_csv(self, path: str = PROFILER_CSV_PATH) -> Optional[str]:
+        """Write the recorded frames to a CSV file.
+
+        Args:
+            path: Output file path
+
+        Returns:
+            Path written, or None if there was nothing to write
+        """
+        if not self.history:
+            return None
+        columns: Dict[str, None] = {}
+        for row in self.history:
+            columns.update(dict.fromkeys(row))
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(columns), restval=0)
+            writer.writeheader()
+            writer.writerows(self.history)
+        return path
+
+# Global profiler instance
+PROFILER = FrameProfiler()
@@ -0,0 +1,207 @@
+"""Replay recording and playback.
+
+A replay stores the RNG seed of a game and the input mask of every
+simulation tick. Re-running those inputs from the same seed on the fixed
+timestep reproduces the game exactly, so periodic state checksums can
+verify a playback tick by tick.
+
+File layout (little endian):
+    header    magic, version, seed, tick rate, keyframe interval
+    runs      (mask u8, length u16) run-length encoded input masks
+    index     (tick u32, offset u32, checksum u32) per keyframe
+    footer    index offset, keyframe count, total ticks, final checksum, magic
+
+Input runs are broken at every keyframe, so each index entry points at the
+run that starts right after its tick and reading can begin there.
+"""
+
+import random
+import struct
+import zlib
+from array import array
+from bisect import bisect_right
+from typing import Dict, Iterator, List, Tuple
+
+from config.settings import SIMULATION_RATE, REPLAY_KEYFRAME_INTERVAL
+
+REPLAY_MAGIC = b'SIRP'
+INDEX_MAGIC = b'SIIX'
+REPLAY_VERSION = 2
+
+_HEADER = struct.Struct('<4sHIHH')
+_RUN = struct.Struct('<BH')
+_KEYFRAME = struct.Struct('<III')
+_FOOTER = struct.Struct('<IIII4s')
+_MAX_RUN = 0xFFFF
+
+def state_checksum(state) -> int:
+    """Compute a checksum of the simulation state of a playing state.
+
+    Covers the simulation clock, score, lives, the position of every
+    gameplay sprite and alien, live effect counts and the global RNG state.
+
+    Args:
+        state: Playing state to checksum
+
+    Returns:
+        CRC32 of the state
+    """
+    values = array('i', (state.clock.get_ticks(), state.score, state.lives))
+    groups = [state.player, state.extra, state.alien_lasers]
+    if state.player.sprite:
+        groups.append(state.player.sprite.lasers)
+    for group in groups:
+        values.append(len(group))
+        for sprite in group:
+            values.extend(sprite.rect.topleft)
+    aliens = state.aliens
+    values.append(aliens.count)
+    values.extend(aliens.x[:aliens.count].tolist())
+    values.extend(aliens.y[:aliens.count].astype('int32').tolist())
+    values.append(state.effects.particles.count)
+    values.append(len(state.effects.animations))
+    checksum = zlib.crc32(values.tobytes())
+    rng_state = array('I', random.getstate()[1])
+    return zlib.crc32(rng_state.tobytes(), checksum)
+
+class ReplayRecorder:
+    """Writes the inputs of a game to a replay file as it is played."""
+
+    def __init__(
+        self,
+        path: str,
+        seed: int,
+        tick_rate: int = SIMULATION_RATE,
+        keyframe_interval: int = REPLAY_KEYFRAME_INTERVAL
+    ):
+        """Open a replay file for writing.
+
+        Args:
+            path: Replay file path
+            seed: Seed the recorded game was reset with
+            tick_rate: Simulation ticks per second
+            keyframe_interval: Ticks between state checksums
+        """
+        self.path = path
+        self.keyframe_interval = keyframe_interval
+        self.ticks = 0
+        self.keyframes: List[Tuple[int, int, int]] = []
+        self._run_mask = 0
+        self._run_length = 0
+        self._file = open(path, 'wb')
+        self._file.write(_HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, seed, tick_rate, keyframe_interval))
+
+    @property
+    def closed(self) -> bool:
+        """Check whether the recording has been finished."""
+        return self._file.closed
+
+    def _flush_run(self) -> None:
+        """Write the pending input run."""
+        if self._run_length:
+            self._file.write(_RUN.pack(self._run_mask, self._run_length))
+            self._run_length = 0
+
+    def record(self, mask: int, state) -> None:
+        """Record the input of a finished tick.
+
+        Args:
+            mask: Input mask the tick was simulated with
+            state: Playing state after the tick, checksummed at keyframes
+        """
+        if mask != self._run_mask or self._run_length == _MAX_RUN:
+            self._flush_run()
+            self._run_mask = mask
+        self._run_length += 1
+        self.ticks += 1
+        if self.ticks % self.keyframe_interval == 0:
+            self._flush_run()
+            self.keyframes.append((self.ticks, self._file.tell(), state_checksum(state)))
+
+    def close(self, state) -> None:
+        """Write the seek index and footer and close the file.
+
+        Args:
+            state: Playing state after the last recorded tick
+        """
+        if self.closed:
+            return
+        self._flush_run()
+        index_offset = self._file.tell()
+        for keyframe in self.keyframes:
+            self._file.write(_KEYFRAME.pack(*keyframe))
+        self._file.write(_FOOTER.pack(
+            index_offset, len(self.keyframes), self.ticks, state_checksum(state), INDEX_MAGIC
+        ))
+        self._file.close()
+
+class ReplayFile:
+    """Reads a replay file."""
+
+    def __init__(self, path: str):
+        """Load and validate a replay file.
+
+        Args:
+            path: Replay file path
+
+        Raises:
+            ValueError: If the file is not a complete replay of a known version
+        """
+        with open(path, 'rb') as f:
+            self._data = f.read()
+        if len(self._data) < _HEADER.size + _FOOTER.size:
+            raise ValueError(f"{path}: file too short for a replay")
+        magic, version, self.seed, self.tick_rate, self.keyframe_interval = _HEADER.unpack_from(self._data)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError(f"{path}: not a version {REPLAY_VERSION} replay")
+        index_offset, count, self.total_ticks, self.final_checksum, index_magic = _FOOTER.unpack_from(
+            self._data, len(self._data) - _FOOTER.size
+        )
+        if index_magic != INDEX_MAGIC:
+            raise ValueError(f"{path}: replay was not closed properly")
+        self._runs_end = index_offset
+        self.keyframes = [
+            _KEYFRAME.unpack_from(self._data, index_offset + i * _KEYFRAME.size)
+            for i in range(count)
+        ]
+        self._keyframe_ticks = [tick for tick, _, _ in self.keyframes]
+        self.checksums: Dict[int, int] = {tick: checksum for tick, _, checksum in self.keyframes}
+        self.checksums[self.total_ticks] = self.final_checksum
+
+    def seek(self, tick: int) -> Tuple[int, int]:
+        """Find the closest keyframe at or before a tick.
+
+        Args:
+            tick: Number of ticks already simulated
+
+        Returns:
+            (keyframe tick, file offset of the inputs that follow it)
+        """
+        i = bisect_right(self._keyframe_ticks, tick)
+        if i == 0:
+            return 0, _HEADER.size
+        keyframe_tick, offset, _ = self.keyframes[i - 1]
+        return keyframe_tick, offset
+
+    def inputs(self, start_tick: int = 0) -> Iterator[int]:
+        """Iterate over input masks.
+
+        Args:
+            start_tick: Number of ticks to skip; reading starts at the
+                nearest keyframe instead of the beginning of the file
+
+        Yields:
+            Input mask of each tick from start_tick + 1 on
+        """
+        tick, offset = self.seek(start_tick)
+        data = self._data
+        while offset < self._runs_end:
+            mask, length = _RUN.unpack_from(data, offset)
+            offset += _RUN.size
+            skip = min(length, start_tick - tick)
+            if skip > 0:
+                tick += skip
+                length -= skip
+            for _ in range(length):
+                yield mask
+            tick += length
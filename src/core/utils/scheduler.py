@@ -0,0 +1,116 @@
+"""Timed-event scheduler driven by the simulation clock."""
+
+import heapq
+from itertools import count
+from typing import Any, Callable, Dict, List, Tuple
+
+from core.utils.sim_clock import SimulationClock
+
+class Timer:
+    """Handle for a scheduled callback."""
+
+    __slots__ = ('due', 'callback', 'args', 'cancelled')
+
+    def __init__(self, due: int, callback: Callable[..., Any], args: Tuple[Any, ...]):
+        """Initialize the timer.
+
+        Args:
+            due: Simulation time in milliseconds the callback runs at
+            callback: Function to call
+            args: Arguments for the callback
+        """
+        self.due = due
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Stop the callback from running."""
+        self.cancelled = True
+
+class TimerScheduler:
+    """Priority queue of callbacks keyed by due time.
+
+    run_due() pops only the timers whose time has come, so the cost of a
+    tick is proportional to the events fired, not to the number of pending
+    timers. Timers with equal due times run in the order they were
+    scheduled. Cancelled timers stay queued and are dropped when popped.
+    """
+
+    def __init__(self, clock: SimulationClock):
+        """Initialize an empty scheduler.
+
+        Args:
+            clock: Simulation clock that due times refer to
+        """
+        self.clock = clock
+        self._heap: List[Tuple[int, int, Timer]] = []
+        self._sequence = count()
+        self.fired = 0
+
+    def __len__(self) -> int:
+        """Get the number of queued timers, including cancelled ones."""
+        return len(self._heap)
+
+    def schedule_at(self, due: int, callback: Callable[..., Any], *args: Any) -> Timer:
+        """Run a callback once the clock reaches a time.
+
+        Args:
+            due: Simulation time in milliseconds
+            callback: Function to call
+            *args: Arguments for the callback
+
+        Returns:
+            Timer that can be cancelled
+        """
+        timer = Timer(due, callback, args)
+        heapq.heappush(self._heap, (due, next(self._sequence), timer))
+        return timer
+
+    def schedule(self, delay: int, callback: Callable[..., Any], *args: Any) -> Timer:
+        """Run a callback after a delay.
+
+        Args:
+            delay: Milliseconds of simulation time from now
+            callback: Function to call
+            *args: Arguments for the callback
+
+        Returns:
+            Timer that can be cancelled
+        """
+        return self.schedule_at(self.clock.get_ticks() + delay, callback, *args)
+
+    def run_due(self) -> int:
+        """Run every timer due at the current clock time.
+
+        Callbacks may schedule new timers; ones already due run in the
+        same call.
+
+        Returns:
+            Number of callbacks run
+        """
+        now = self.clock.get_ticks()
+        heap = self._heap
+        fired = 0
+        while heap and heap[0][0] <= now:
+            timer = heapq.heappop(heap)[2]
+            if not timer.cancelled:
+                timer.callback(*timer.args)
+                fired += 1
+        self.fired += fired
+        return fired
+
+    def clear(self) -> None:
+        """Drop all queued timers."""
+        self._heap.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Get scheduler counters.
+
+        Returns:
+            Dictionary with queued timer count and total callbacks fired
+        """
+        return {
+            'queued': len(self._heap),
+            'fired': self.fired
+        }
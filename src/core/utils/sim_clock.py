@@ -0,0 +1,33 @@
+"""Simulation clock for gameplay timers."""
+
+class SimulationClock:
+    """Millisecond clock advanced by simulated time instead of the wall clock.
+
+    GameStateManager owns the clock and advances it one fixed step for each
+    tick of a state that runs the simulation, so it stops while the game is
+    paused and runs faster than real time when more ticks are simulated per
+    frame. Entities receive the clock instead of reading pygame's timer.
+    """
+
+    def __init__(self):
+        """Initialize the clock at zero."""
+        self.time = 0.0
+        self.ticks = 0
+
+    def reset(self) -> None:
+        """Set the clock back to zero."""
+        self.time = 0.0
+        self.ticks = 0
+
+    def advance(self, dt: float) -> None:
+        """Advance the clock by one simulation tick.
+
+        Args:
+            dt: Simulated time in seconds
+        """
+        self.time += dt * 1000.0
+        self.ticks += 1
+
+    def get_ticks(self) -> int:
+        """Get simulated milliseconds, like pygame.time.get_ticks()."""
+        return int(self.time)
@@ -1,54 +1,266 @@
 """Sound management singleton."""
 
-from typing import Dict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
 import pygame
 
+from core.utils.music_player import MusicPlayer
+from core.utils.profiler import PROFILER
 from config.settings import (
     AUDIO_DIR,
-    MUSIC_VOLUME,
-    LASER_VOLUME,
-    EXPLOSION_VOLUME
+    SOUND_EFFECTS,
+    SOUND_CHANNELS,
+    SOUND_VOICES,
+    SOUND_MAX_VOICES,
+    GAME_OPTIONS
 )
 
+# Decoded sounds by file path, filled ahead of time by the asset preloader
+_decoded: Dict[str, pygame.mixer.Sound] = {}
+
+def load_sound(path: Union[str, Path]) -> pygame.mixer.Sound:
+    """Get a decoded sound, decoding each file only once.
+
+    Args:
+        path: Path to the sound file
+
+    Returns:
+        Shared Sound object
+
+    Raises:
+        pygame.error: If the file can't be decoded
+        FileNotFoundError: If the file doesn't exist
+    """
+    key = str(path)
+    sound = _decoded.get(key)
+    if sound is None:
+        sound = _decoded[key] = pygame.mixer.Sound(key)
+    return sound
+
+def add_decoded_sound(path: Union[str, Path], sound: pygame.mixer.Sound) -> None:
+    """Cache a sound decoded elsewhere so load_sound() returns it.
+
+    Args:
+        path: Path the sound was decoded from
+        sound: Decoded sound
+    """
+    _decoded[str(path)] = sound
+
 class SoundManager:
-    """Singleton class for managing game sounds."""
-    
+    """Singleton sound bank that preloads effects and schedules them once per frame.
+
+    Every effect in SOUND_EFFECTS is decoded once when the bank is created.
+    Each sound category gets a fixed slice of reserved mixer channels, so
+    playing a sound never loads files or allocates Sound objects. Music is
+    streamed by MusicPlayer instead of being decoded here.
+
+    play() only records a request. flush(), called once at the end of each
+    frame, merges repeated requests for the same sound into one voice and
+    starts them in priority order within the limits of SOUND_VOICES and
+    SOUND_MAX_VOICES, cutting off older lower-priority voices if needed.
+    Requests that still don't fit are dropped.
+    """
+
     _instance = None
     _initialized = False
-    
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
-    
+
     def __init__(self):
         if not self._initialized:
-            self._sounds: Dict[str, pygame.mixer.Sound] = {
-                'music': pygame.mixer.Sound(str(AUDIO_DIR / 'music.wav')),
-                'laser': pygame.mixer.Sound(str(AUDIO_DIR / 'laser.wav')),
-                'explosion': pygame.mixer.Sound(str(AUDIO_DIR / 'explosion.wav'))
-            }
-            
-            # Set volumes
-            self._sounds['music'].set_volume(MUSIC_VOLUME)
-            self._sounds['laser'].set_volume(LASER_VOLUME)
-            self._sounds['explosion'].set_volume(EXPLOSION_VOLUME)
-            
+            self._sounds: Dict[str, pygame.mixer.Sound] = {}
+            self._categories: Dict[str, str] = {}
+            self._pools: Dict[str, List[pygame.mixer.Channel]] = {}
+            # Requests this frame in arrival order: name -> count
+            self._requests: Dict[str, int] = {}
+            # Voices started by flush(): channel -> (name, start sequence)
+            self._voices: Dict[pygame.mixer.Channel, Tuple[str, int]] = {}
+            self._sequence = 0
+            self.requests = 0
+            self.played = 0
+            self.merged = 0
+            self.dropped = 0
+            self.stolen = 0
+            self.enabled = pygame.mixer.get_init() is not None
+
+            if self.enabled:
+                self._reserve_channels()
+                self._load_sounds()
+
             self._initialized = True
-    
+
+    def _reserve_channels(self) -> None:
+        """Reserve a fixed block of mixer channels for each sound category."""
+        total = sum(SOUND_CHANNELS.values())
+        # Leave some unreserved channels for anything played outside the bank
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), total + 2))
+        pygame.mixer.set_reserved(total)
+
+        index = 0
+        for category, count in SOUND_CHANNELS.items():
+            self._pools[category] = [pygame.mixer.Channel(index + i) for i in range(count)]
+            index += count
+
+    def _load_sounds(self) -> None:
+        """Decode all sound effects."""
+        for name, (filename, category, volume) in SOUND_EFFECTS.items():
+            try:
+                sound = load_sound(AUDIO_DIR / filename)
+            except (pygame.error, FileNotFoundError):
+                continue
+            sound.set_volume(volume)
+            self._sounds[name] = sound
+            self._categories[name] = category
+
+    def play(self, name: str) -> None:
+        """Request a preloaded sound effect for the end of this frame.
+
+        Args:
+            name: Name of the sound effect in SOUND_EFFECTS
+        """
+        if not GAME_OPTIONS.sound_effects_enabled or name not in self._sounds:
+            return
+        self.requests += 1
+        self._requests[name] = self._requests.get(name, 0) + 1
+
+    def flush(self) -> None:
+        """Start this frame's requested sounds and clear the requests."""
+        if not self._requests:
+            return
+        requests = self._requests
+        self._requests = {}
+        # Voices that finished since the last flush no longer count
+        voices = {channel: voice for channel, voice in self._voices.items() if channel.get_busy()}
+        merged = 0
+        dropped = 0
+        # Highest priority first; sorting is stable, so ties keep arrival order
+        for name in sorted(requests, key=lambda name: -SOUND_VOICES[name][0]):
+            merged += requests[name] - 1
+            channel = self._pick_channel(name, voices)
+            if channel is None:
+                dropped += 1
+                continue
+            if channel in voices:
+                self.stolen += 1
+            channel.play(self._sounds[name])
+            self._sequence += 1
+            voices[channel] = (name, self._sequence)
+            self.played += 1
+        self._voices = voices
+        self.merged += merged
+        self.dropped += dropped
+        PROFILER.count('sounds_merged', merged)
+        PROFILER.count('sounds_dropped', dropped)
+
+    def _pick_channel(
+        self,
+        name: str,
+        voices: Dict[pygame.mixer.Channel, Tuple[str, int]]
+    ) -> Optional[pygame.mixer.Channel]:
+        """Choose the channel for a new voice, freeing one if the limits require it.
+
+        Args:
+            name: Sound to play
+            voices: Playing voices, updated if one is stopped
+
+        Returns:
+            Channel to play on (possibly one still playing, to be cut off),
+            or None if the sound has to be dropped
+        """
+        def oldest(channels: List[pygame.mixer.Channel]) -> pygame.mixer.Channel:
+            return min(channels, key=lambda channel: voices[channel][1])
+
+        priority, max_voices = SOUND_VOICES[name]
+        # At its own limit a sound restarts its oldest voice
+        own = [channel for channel, (playing, _) in voices.items() if playing == name]
+        if len(own) >= max_voices:
+            return oldest(own)
+
+        pool = self._pools[self._categories[name]]
+        free = [channel for channel in pool if channel not in voices and not channel.get_busy()]
+        if not free:
+            # Only when the sounds sharing a category outnumber its channels
+            victims = [
+                channel for channel in pool
+                if channel in voices and SOUND_VOICES[voices[channel][0]][0] <= priority
+            ]
+            return oldest(victims) if victims else None
+
+        if len(voices) >= SOUND_MAX_VOICES:
+            victims = [channel for channel, (playing, _) in voices.items() if SOUND_VOICES[playing][0] < priority]
+            if not victims:
+                return None
+            victim = oldest(victims)
+            victim.stop()
+            del voices[victim]
+            self.stolen += 1
+        return free[0]
+
+    def stats(self) -> Dict[str, int]:
+        """Get scheduling counters.
+
+        Returns:
+            Dictionary with request, played, merged, dropped and stolen
+            voice counts since the bank was created
+        """
+        return {
+            'requests': self.requests,
+            'played': self.played,
+            'merged': self.merged,
+            'dropped': self.dropped,
+            'stolen': self.stolen
+        }
+
     def play_music(self) -> None:
         """Start playing background music in loop."""
-        self._sounds['music'].play(loops=-1)
-    
+        MusicPlayer().play()
+
     def play_laser(self) -> None:
         """Play laser sound effect."""
-        self._sounds['laser'].play()
-    
+        self.play('laser')
+
     def play_explosion(self) -> None:
         """Play explosion sound effect."""
-        self._sounds['explosion'].play()
-    
+        self.play('explosion')
+
     def stop_all(self) -> None:
         """Stop all sounds."""
         for sound in self._sounds.values():
             sound.stop()
+        self._requests.clear()
+        self._voices.clear()
+        MusicPlayer().stop()
+
+    def memory_bytes(self) -> int:
+        """Get the resident audio memory: decoded effects plus the music buffer.
+
+        Returns:
+            Total bytes
+        """
+        stats = self.memory_stats()
+        return stats['effects_bytes'] + stats['music_buffer_bytes']
+
+    def memory_stats(self) -> Dict[str, int]:
+        """Get the resident audio memory by kind.
+
+        Effects are held as raw PCM in the mixer's format, so their size
+        follows from their length.
+
+        Returns:
+            Dictionary with effect count, effect bytes and music buffer bytes
+        """
+        effects = 0
+        mixer = pygame.mixer.get_init()
+        if mixer is not None:
+            frequency, size, channels = mixer
+            frame_bytes = channels * (abs(size) // 8)
+            for sound in self._sounds.values():
+                effects += round(sound.get_length() * frequency) * frame_bytes
+        return {
+            'effects': len(self._sounds),
+            'effects_bytes': effects,
+            'music_buffer_bytes': MusicPlayer().buffer_bytes()
+        }
@@ -0,0 +1,81 @@
+"""Startup timing report."""
+
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+
+class StartupTimer:
+    """Breaks down the time from launch to the first presented frame.
+
+    Times are measured from the import of this module, so main.py imports
+    it before anything else. Phases are timed with measure(); finish()
+    closes the report at the first frame. States built later, on first
+    entry, are still timed and reported one line each.
+    """
+
+    def __init__(self):
+        """Start timing."""
+        self.origin = time.perf_counter()
+        self.enabled = False
+        self.phases: List[Tuple[str, float]] = []
+        self.deferred: List[Tuple[str, float]] = []
+        self.total: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        """Check whether the first frame has been presented."""
+        return self.total is not None
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Time a startup phase.
+
+        Args:
+            name: Phase name shown in the report
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name: str, seconds: float) -> None:
+        """Add a timed phase.
+
+        Args:
+            name: Phase name shown in the report
+            seconds: Duration of the phase
+        """
+        if not self.finished:
+            self.phases.append((name, seconds))
+            return
+        self.deferred.append((name, seconds))
+        if self.enabled:
+            print(f"Startup: {name} took {seconds * 1000.0:.1f} ms (after first frame)")
+
+    def finish(self) -> None:
+        """Close the report at the first presented frame and print it if enabled."""
+        if self.finished:
+            return
+        self.total = time.perf_counter() - self.origin
+        if self.enabled:
+            print("\n".join(self.report()))
+
+    def report(self) -> List[str]:
+        """Format the time to first frame by phase.
+
+        Returns:
+            Report lines
+        """
+        total = self.total if self.finished else time.perf_counter() - self.origin
+        lines = ["Startup to first frame:"]
+        measured = 0.0
+        for name, seconds in self.phases:
+            measured += seconds
+            lines.append(f"  {name:<24}{seconds * 1000.0:9.1f} ms")
+        lines.append(f"  {'other':<24}{(total - measured) * 1000.0:9.1f} ms")
+        lines.append(f"  {'total':<24}{total * 1000.0:9.1f} ms")
+        return lines
+
+# Global startup timer instance
+STARTUP = StartupTimer()
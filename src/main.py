@@ -1,11 +1,77 @@
 """Main entry point for Space Invaders game."""
 
-from core.game_controller import GameController
+# Imported first: the startup report measures from here
+from core.utils.startup import STARTUP
+
+with STARTUP.measure("imports"):
+    import argparse
+    import sys
+    
+    from core.game_controller import GameController
+    from core.utils.profiler import PROFILER
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Space Invaders")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="run without a window or audio device, uncapped, starting in gameplay"
+    )
+    parser.add_argument("--frames", type=int, default=None, help="stop a headless run after N frames")
+    parser.add_argument("--games", type=int, default=None, help="stop a headless run after N game overs")
+    parser.add_argument(
+        "--realtime",
+        action="store_true",
+        help="in headless mode, advance by wall-clock time instead of one tick per frame"
+    )
+    parser.add_argument(
+        "--time-scale",
+        type=float,
+        default=1.0,
+        help="simulated seconds per real second, e.g. 4 to fast-forward (windowed and --realtime runs)"
+    )
+    parser.add_argument("--no-render", action="store_true", help="in headless mode, skip drawing")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="start with the frame profiler on (toggle in game with F3); writes a CSV on exit"
+    )
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="print how long each startup step took up to the first frame"
+    )
+    parser.add_argument("--seed", type=int, default=None, help="seed for the first game")
+    parser.add_argument("--record", metavar="PATH", default=None, help="record the first game to a replay file")
+    parser.add_argument(
+        "--replay",
+        metavar="PATH",
+        default=None,
+        help="verify a replay file headless at full speed and exit"
+    )
+    return parser.parse_args()
 
 def main():
     """Initialize and run the game."""
-    game = GameController()
-    game.run()
+    args = parse_args()
+    PROFILER.set_enabled(args.profile)
+    STARTUP.enabled = args.startup_report
+    if args.replay:
+        game = GameController(headless=True)
+        ok = game.run_replay(args.replay, render=not args.no_render)
+        sys.exit(0 if ok else 1)
+    game = GameController(headless=args.headless, seed=args.seed, record_path=args.record)
+    game.set_time_scale(args.time_scale)
+    if args.headless:
+        game.run_headless(
+            max_frames=args.frames,
+            max_games=args.games,
+            fixed_step=not args.realtime,
+            render=not args.no_render
+        )
+    else:
+        game.run()
 
 if __name__ == '__main__':
     main()